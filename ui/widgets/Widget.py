@@ -14,7 +14,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import yaml
 
-from PySide6.QtCore import Qt, QThreadPool, QTimer, QPoint, Slot
+from PySide6.QtCore import Qt, QTimer, QPoint, Slot
 from PySide6.QtGui import QAction, QBrush, QColor, QCloseEvent
 from PySide6.QtWidgets import (QWidget, QMessageBox, QTableView, QTreeWidgetItem,
                                QInputDialog, QLineEdit, QMenu, QApplication)
@@ -34,6 +34,25 @@ from utils.workers import PollingWorker, Worker
 # from guppy import hpy
 
 
+_BRUSHES: Dict[str, QBrush] = {}
+
+
+def _brush(color: str) -> QBrush:
+    """
+    Returns a shared QBrush of the given color. Brushes are created on first request and reused
+    afterwards, so repainting the serials tree does not allocate new brushes for every item.
+
+    :param color:   The color name ('red', 'gray' or 'black').
+    :type color:    str
+    :return:        The cached brush of the given color.
+    :rtype:         QBrush
+    """
+    brush = _BRUSHES.get(color)
+    if brush is None:
+        brush = _BRUSHES[color] = QBrush(QColor(color))
+    return brush
+
+
 class Serial:
     """
     A class for managing serial port connections
@@ -59,7 +78,6 @@ class Serial:
 
 class Daemon:
     """A class that represents a daemon for managing worker threads and polling devices
-    :ivar threadpool: A `QThreadPool` instance used to manage worker threads
     :ivar data_file: An optional string representing the path to a data file
     :ivar is_polling: A boolean indicating whether polling is currently enabled
     :ivar devices: A dictionary mapping device names to device objects
@@ -71,8 +89,6 @@ class Daemon:
     """
     # pylint: disable=too-few-public-methods, too-many-instance-attributes
     def __init__(self) -> None:
-        self.threadpool = QThreadPool()
-        print(f"Multithreading with maximum {self.threadpool.maxThreadCount()} threads")
         self.data_file: Optional[str] = None
         self.is_polling: bool = False
         self.devices: Dict = {}
@@ -122,7 +138,7 @@ class Widget(QWidget, LoadUiMixin):
             initial_tab = self.ui.tabWidget.findChild(QWidget, 'tab3')
         self.ui.tabWidget.setCurrentWidget(initial_tab)
 
-        # !!!=== configure threadpool ===!!! #
+        # !!!=== configure workers ===!!! #
         self.dmn: Daemon = Daemon()
         self.dmn.onPollingDisabled = [self.ui.test_poll_btn,
                                       self.ui.addDevice,
@@ -241,7 +257,7 @@ class Widget(QWidget, LoadUiMixin):
             for btn in self.dmn.onPollingDisabled:
                 btn.setEnabled(not self.dmn.is_polling)
             for worker in self.dmn.workers.values():
-                self.dmn.threadpool.start(worker)
+                worker.start()
         else:
             self._kill_pollers()
             for key in list(self.widgets['charts'].keys()):
@@ -270,7 +286,7 @@ class Widget(QWidget, LoadUiMixin):
         if self.dmn.is_polling is False:
             self._init_pollers()
             for worker in self.dmn.workers.values():
-                self.dmn.threadpool.start(worker)
+                worker.start()
             # self._kill_pollers()
 
     def _init_pollers(self) -> None:
@@ -279,8 +295,8 @@ class Widget(QWidget, LoadUiMixin):
 
         Each device's poller is set up with the device's settings and registers,
         and a polling worker is created for each device. The polling worker
-        is started on a separate thread, and its result signal is connected to the 
-        `worker_exec` slot.
+        runs on the event loop shared by all the pollers, its latest result is taken by 
+        `daemon_fn` and passed to `worker_exec`.
 
         The memory worker is also created and started on a separate thread. Its result signal
         is connected to the `mem_worker_res` slot, and its finished signal is connected to the
@@ -297,7 +313,6 @@ class Widget(QWidget, LoadUiMixin):
             poller.registers = device['registers']
             worker: PollingWorker = PollingWorker(guid=guid, sleep=1000, fn=self.polling)
             worker.poller = poller
-            worker.signals.result.connect(self.worker_exec)
             self.dmn.workers[guid] = worker
 
     def _kill_pollers(self) -> None:
@@ -307,6 +322,8 @@ class Widget(QWidget, LoadUiMixin):
         """
         self.dmn.register_counter = 0
         if self.dmn.workers:
+            for worker in self.dmn.workers.values():
+                worker.stop()
             self.dmn.workers.clear()
 
     @Slot(dict)
@@ -330,10 +347,10 @@ class Widget(QWidget, LoadUiMixin):
                         "TCP0",
                         "Signed",
                         "Yes",
-                        [
-                            true,
-                            true,
-                            true
+                        [                                           <<< Ключ запроса (функция,
+                            1,                                          адрес, количество), 
+                            0,                                          ответ - Poller.last_response
+                            3
                         ],
                         "04-04-2023 13:28:26",
                         true
@@ -360,14 +377,18 @@ class Widget(QWidget, LoadUiMixin):
         :return:    nothing
         :rtype:     None
         """
+        # Забираем последние результаты воркеров: опрос может быть чаще обновления GUI
+        for worker in list(self.dmn.workers.values()):
+            if worker.latest:
+                self.worker_exec(worker.latest.popleft())
         if self.dmn.table_data != self.dmn.workers_data:
             self.dmn.table_data = copy.deepcopy(self.dmn.workers_data)
+            # Воркер присылает строки только при изменении значений: признак новизны 
+            # сбрасывается один раз, неизменные значения не считаются устаревшими
             for device in self.dmn.workers_data.values():
                 for register in device:
                     if register[9] is True:
                         register[9] = False
-                    elif register[9] is False:
-                        register[9] = None
             data = list(chain.from_iterable(self.dmn.table_data.values()))
             status = [['', value[9] if value[6] is not None else None] for value in data]
             self.tables['status_tb'].load(data=status)
@@ -376,10 +397,13 @@ class Widget(QWidget, LoadUiMixin):
             else:
                 self.tables['data_tb'].update(data=data, columns=[6])
             
-            if self.dmn.is_polling:
-                if self.dmn.register_counter == len(data):
-                    self.store_to_csv(data=data)
-                self.draw_chart(data=data)
+        if self.dmn.is_polling:
+            # Последние значения пишутся в файл и на графики на каждом тике, 
+            # в том числе когда они не менялись
+            data = list(chain.from_iterable(self.dmn.table_data.values()))
+            if self.dmn.register_counter == len(data):
+                self.store_to_csv(data=data)
+            self.draw_chart(data=data)
 
     def store_to_csv(self, data: List) -> None:
         """
@@ -479,8 +503,12 @@ class Widget(QWidget, LoadUiMixin):
                                                    items.index(cur_value), 
                                                    False)
             if submitted:
-                self.dmn.workers[guid].writeSingleCoil(address=address,
-                                                       value=bool(items.index(text)))
+                result = self.dmn.workers[guid].writeSingleCoil(address=address,
+                                                                value=bool(items.index(text)))
+                if result is False:
+                    msgBox_fn(text='Не удалось записать значение в устройство.',
+                              title='Ошибка записи',
+                              buttons=QMessageBox.Ok)
         elif fn == 3:
             text, submitted = QInputDialog.getText(self, 
                                                    'Введите знечение', 
@@ -494,10 +522,14 @@ class Widget(QWidget, LoadUiMixin):
                                                            data_format=value_format,
                                                            adj=register['adjustments'],
                                                            value=text)
-                if result is False:
+                if result is None:
                     msgBox_fn(text='Введён некорректный формат данных.',
                               title='Ошибка формата данных',
                               buttons=QMessageBox.Ok)
+                elif result is False:
+                    msgBox_fn(text='Не удалось записать значение в устройство.',
+                              title='Ошибка записи',
+                              buttons=QMessageBox.Ok)
     
     def data_tb_open_chart(self) -> None:
         """
@@ -758,26 +790,25 @@ class Widget(QWidget, LoadUiMixin):
         :return:    nothing
         :rtype:     None
         """
-        root = self.ui.serials_tw.invisibleRootItem()
-        for item in range(root.childCount()):
-            color = 'black'
-            serial = root.child(item)
-            if serial.text(0) not in self.serial.fact:
-                # если порта в системе нет
-                color = 'red'
-                self.map_serial_parameters(serial, color)
-            elif serial.text(0) not in list(self.serial.config.keys()):
-                # если порта в конфиге нет
-                if self.map_serial_parameters(serial, 'gray'):
-                    color = 'black'
+        tree = self.ui.serials_tw
+        root = tree.invisibleRootItem()
+        # перекрашиваем дерево целиком и перерисовываем его один раз
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        try:
+            for item in range(root.childCount()):
+                serial = root.child(item)
+                if serial.text(0) not in self.serial.fact:
+                    # если порта в системе нет
+                    color = 'red'
+                    self.map_serial_parameters(serial, color)
                 else:
-                    color = 'gray'
-            else:
-                if self.map_serial_parameters(serial, 'gray'):
-                    color = 'black'
-                else:
-                    color = 'gray'
-            serial.setForeground(0, QBrush(QColor(color)))
+                    color = 'black' if self.map_serial_parameters(serial, 'gray') else 'gray'
+                serial.setForeground(0, _brush(color))
+        finally:
+            tree.blockSignals(False)
+            tree.setUpdatesEnabled(True)
+            tree.viewport().update()
 
     def map_serial_parameters(self, serial: QTreeWidgetItem, color: str) -> bool:
         """Maps the parameters of the given serial port and sets the color for the items.
@@ -790,23 +821,19 @@ class Widget(QWidget, LoadUiMixin):
         :rtype: bool
         """
         result = True
-        child_count = serial.childCount()
-        if child_count:
-            for child_index in range(child_count):
-                item = serial.child(child_index)
-                if item.text(1) != 'None':
-                    if serial.text(0) in self.serial.fact:
-                        set_color = 'black'
-                    else:
-                        set_color = 'red'
+        for child_index in range(serial.childCount()):
+            item = serial.child(child_index)
+            if item.text(1) != 'None':
+                if serial.text(0) in self.serial.fact:
+                    set_color = 'black'
                 else:
-                    set_color = color
-                    result = False
-                item.setForeground(0, QBrush(QColor(set_color)))
-                item.setForeground(1, QBrush(QColor(set_color)))
-        else:
-            # raise Exception
-            print('map_serial_parameters -> нет параметров')
+                    set_color = 'red'
+            else:
+                set_color = color
+                result = False
+            brush = _brush(set_color)
+            item.setForeground(0, brush)
+            item.setForeground(1, brush)
         return result
 
     def save_config(self) -> None:
@@ -832,8 +859,9 @@ class Widget(QWidget, LoadUiMixin):
         _ = event
         QApplication.setOverrideCursor(Qt.WaitCursor)
         self.dmn.is_polling = False
-        while self.dmn.threadpool.activeThreadCount():
-            pass
+        for worker in self.dmn.workers.values():
+            worker.stop()
+        Worker.wait_all()
         for key in list(self.widgets['charts'].keys()):
             self.widgets['charts'][key].close()
         QApplication.restoreOverrideCursor()
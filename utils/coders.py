@@ -9,11 +9,105 @@ __version__ = "1.0"
 __license__ = "MIT License"
 
 
-from typing import Dict, List
-import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import string
+import struct
 
 from pymodbus.constants import Endian
-from pymodbus.payload import BinaryPayloadDecoder, BinaryPayloadBuilder
+
+
+# binary representation of every byte value split into nibbles, e.g. 0x5A -> '0101 1010'
+_BYTE_BITS: Tuple[str, ...] = tuple(f'{byte >> 4:04b} {byte & 0xF:04b}' for byte in range(256))
+
+_TYPE_NAMES: Dict[str, str] = {'i': '32-bit integer',
+                               'f': '32-bit float',
+                               'd': '64-bit float', }
+
+
+@lru_cache(maxsize=None)
+def _structs(fmt: str, byteorder: str, wordorder: str,
+             count: int = 1) -> Tuple[struct.Struct, struct.Struct]:
+    """
+    Builds a pair of precompiled structs converting between a list of 16-bit registers and
+    a value of the given struct format with the given byte and word order.
+
+    Registers are packed with the endianness that already accounts for both the byte swap and
+    the word swap, so the resulting bytes can be unpacked as a single value without reordering
+    registers or swapping bytes in Python.
+
+    :param fmt:         Struct format character of the value ('h', 'i', 'f' or 'd').
+    :type fmt:          str
+    :param byteorder:   Byte order within a register (Endian.Big or Endian.Little).
+    :type byteorder:    str
+    :param wordorder:   Order of the registers (Endian.Big or Endian.Little).
+    :type wordorder:    str
+    :param count:       Number of consecutive values converted at once.
+    :type count:        int
+    :return:            Registers struct and value struct.
+    :rtype:             Tuple[struct.Struct, struct.Struct]
+    """
+    words: int = struct.calcsize(fmt) // 2
+    registers_order: str = Endian.Little if (byteorder == Endian.Little) != (
+        wordorder == Endian.Little) else Endian.Big
+    return (struct.Struct(registers_order + 'H' * words * count),
+            struct.Struct(wordorder + fmt * count))
+
+
+def _describe(action: str, fmt: str, byteorder: str, wordorder: str) -> str:
+    order = {Endian.Big: 'big-endian', Endian.Little: 'little-endian'}
+    return (f"{action} {_TYPE_NAMES[fmt]} ({order[byteorder]} bytes, "
+            f"{order[wordorder]} words).")
+
+
+def _make_decoder(fmt: str, byteorder: str, wordorder: str) -> Callable:
+    """
+    Creates a Decoder method decoding a value of the given struct format from a list of registers
+    with the given byte and word order.
+
+    :param fmt:         Struct format character of the value ('i', 'f' or 'd').
+    :type fmt:          str
+    :param byteorder:   Byte order within a register (Endian.Big or Endian.Little).
+    :type byteorder:    str
+    :param wordorder:   Order of the registers (Endian.Big or Endian.Little).
+    :type wordorder:    str
+    :return:            Decoder method.
+    :rtype:             Callable
+    """
+    registers, value_struct = _structs(fmt, byteorder, wordorder)
+    pack, unpack, words = registers.pack, value_struct.unpack, registers.size // 2
+
+    def decode(self, value: List) -> Union[int, float]:  # pylint: disable=unused-argument
+        return unpack(pack(*value[:words]))[0]
+
+    decode.__doc__ = _describe('Decodes', fmt, byteorder, wordorder)
+    decode.spec = (fmt, byteorder, wordorder)
+    return decode
+
+
+def _make_encoder(fmt: str, byteorder: str, wordorder: str) -> Callable:
+    """
+    Creates an Encoder method encoding a value of the given struct format as a list of registers
+    with the given byte and word order.
+
+    :param fmt:         Struct format character of the value ('i', 'f' or 'd').
+    :type fmt:          str
+    :param byteorder:   Byte order within a register (Endian.Big or Endian.Little).
+    :type byteorder:    str
+    :param wordorder:   Order of the registers (Endian.Big or Endian.Little).
+    :type wordorder:    str
+    :return:            Encoder method.
+    :rtype:             Callable
+    """
+    registers, value_struct = _structs(fmt, byteorder, wordorder)
+    pack, unpack = value_struct.pack, registers.unpack
+    cast = int if fmt == 'i' else float
+
+    def encode(self, value: str) -> List[int]:  # pylint: disable=unused-argument
+        return list(unpack(pack(cast(value))))
+
+    encode.__doc__ = _describe('Encodes', fmt, byteorder, wordorder)
+    return encode
 
 
 class Decoder:
@@ -33,7 +127,7 @@ class Decoder:
         :return: Decoded data in signed integer format.
         :rtype: int
         """
-        return int(value[0]) - 65536 if int(value[0]) > 32767 else int(value[0])
+        return ((value[0] & 0xFFFF) ^ 0x8000) - 0x8000
     
     def unsigned(self, value: List) -> int:
         """
@@ -66,212 +160,108 @@ class Decoder:
         :return: Decoded data in binary format.
         :rtype: str
         """
-        return ' '.join([format(value[0], '016b')[4*x:4*(x+1)] for x in range(4)])
-    
-    def long_ab_cd(self, value: List) -> int:
-        """
-        Decodes 32-bit integer from the given list value in the format AB-CD
-        (big-endian).
-
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit integer format.
-        :rtype: int
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Big,
-                                                  wordorder=Endian.Big).decode_32bit_int()
-    
-    def long_cd_ab(self, value: List) -> int:
-        """
-        Decodes 32-bit integer from the given list value in the format CD-AB
-        (little-endian).
+        return self.binary_batch(value[:1])[0]
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit integer format.
-        :rtype: int
+    def binary_batch(self, values: Sequence[int]) -> List[str]:
         """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Big,
-                                                  wordorder=Endian.Little).decode_32bit_int()
-    
-    def long_ba_dc(self, value: List) -> int:
-        """
-        Decodes 32-bit integer from the given list value in the format BA-DC
-        (little-endian, swapped bytes).
+        Decodes binary strings from the given registers.
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit integer format.
-        :rtype: int
+        :param values: A sequence of registers to decode.
+        :type values: Sequence[int]
+        :return: Decoded data in binary format, one string per register.
+        :rtype: List[str]
         """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Little,
-                                                  wordorder=Endian.Big).decode_32bit_int()
-    
-    def long_dc_ba(self, value: List) -> int:
-        """
-        Decodes 32-bit integer from the given list value in the format DC-BA
-        (little-endian, swapped words).
+        bits = _BYTE_BITS
+        return [f'{bits[value >> 8]} {bits[value & 0xFF]}' for value in values]
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit integer format.
-        :rtype: int
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Little,
-                                                  wordorder=Endian.Little).decode_32bit_int()
-    
-    def float_ab_cd(self, value: List) -> float:
+    def hex_ascii_batch(self, values: Sequence[int]) -> List[str]:
         """
-        Decodes 32-bit float from the given list value in the format AB-CD
-        (big-endian).
+        Decodes hexadecimal ASCII strings from the given registers.
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit float format.
-        :rtype: float
+        :param values: A sequence of registers to decode.
+        :type values: Sequence[int]
+        :return: Decoded data in hexadecimal ASCII format, one string per register.
+        :rtype: List[str]
         """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Big,
-                                                  wordorder=Endian.Big).decode_32bit_float()
-    
-    def float_cd_ab(self, value: List) -> float:
-        """
-        Decodes 32-bit float from the given list value in the format CD-AB
-        (little-endian).
+        return list(map(hex, values))
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit float format.
-        :rtype: float
+    def batch_decoder(self, name: str, count: int) -> Callable[[Sequence[int]], List]:
         """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Big,
-                                                  wordorder=Endian.Little).decode_32bit_float()
-    
-    def float_ba_dc(self, value: List) -> float:
-        """
-        Decodes 32-bit float from the given list value in the format BA-DC
-        (little-endian, swapped bytes).
+        Creates a function decoding `count` consecutive values of the same format at once.
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit float format.
-        :rtype: float
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Little,
-                                                  wordorder=Endian.Big).decode_32bit_float()
-    
-    def float_dc_ba(self, value: List) -> float:
-        """
-        Decodes 32-bit float from the given list value in the format DC-BA
-        (little-endian, swapped words).
+        Integer and 32/64-bit formats are decoded with a single unpack by precompiled structs, 
+        binary and hexadecimal strings are built in a single pass over the registers.
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 32-bit float format.
-        :rtype: float
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Little,
-                                                  wordorder=Endian.Little).decode_32bit_float()
-    
-    def double_ab_cd_ef_gh(self, value: List) -> float:
+        :param name: Name of the decoder method, e.g. 'float_ab_cd'.
+        :type name: str
+        :param count: Number of values to decode.
+        :type count: int
+        :return: A function taking exactly as many registers as `count` values occupy and
+                 returning the decoded values.
+        :rtype: Callable[[Sequence[int]], List]
         """
-        Decodes 64-bit float from the given list value in the format AB-CD-EF-GH
-        (big-endian).
+        if name == 'binary':
+            return self.binary_batch
+        if name == 'hex_ascii':
+            return self.hex_ascii_batch
+        if name == 'unsigned':
+            return lambda values: [int(value) for value in values]
+        spec: Optional[Tuple[str, str, str]] = (('h', Endian.Big, Endian.Big) if name == 'signed'
+                                                 else getattr(getattr(self, name), 'spec', None))
+        if spec is None:
+            method = getattr(self, name)
+            return lambda values: [method(values[i:i + 1]) for i in range(len(values))]
+        registers, value_struct = _structs(*spec, count)
+        pack, unpack = registers.pack, value_struct.unpack
+        return lambda values: list(unpack(pack(*values)))
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 64-bit float format.
-        :rtype: float
+    def decode_batch(self, name: str, values: List) -> List:
         """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Big,
-                                                  wordorder=Endian.Big).decode_64bit_float()
-    
-    def double_gh_ef_cd_ab(self, value: List) -> float:
-        """
-        Decodes 64-bit float from the given list value in the format GH-EF-CD-AB
-        (big-endian, swapped bytes).
+        Decodes consecutive values of the same format from the given list of registers.
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 64-bit float format.
-        :rtype: float
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Big,
-                                                  wordorder=Endian.Little).decode_64bit_float()
-    
-    def double_ba_dc_fe_hg(self, value: List) -> float:
+        :param name: Name of the decoder method, e.g. 'float_ab_cd'.
+        :type name: str
+        :param values: A list of registers containing consecutive values to decode.
+        :type values: List
+        :return: Decoded values.
+        :rtype: List
         """
-        Decodes 64-bit float from the given list value in the format BA-DC-FE-HG
-        (little-endian, swapped words).
+        spec = getattr(getattr(self, name), 'spec', None)
+        words: int = struct.calcsize(spec[0]) // 2 if spec else 1
+        count: int = len(values) // words
+        return self.batch_decoder(name, count)(values[:count * words])
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 64-bit float format.
-        :rtype: float
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Little,
-                                                  wordorder=Endian.Big).decode_64bit_float()
-    
-    def double_hg_fe_dc_ba(self, value: List) -> float:
-        """
-        Decodes 64-bit float from the given list value in the format HG-FE-DC-BA
-        (little-endian, swapped words).
+    long_ab_cd = _make_decoder('i', byteorder=Endian.Big, wordorder=Endian.Big)
+    long_cd_ab = _make_decoder('i', byteorder=Endian.Big, wordorder=Endian.Little)
+    long_ba_dc = _make_decoder('i', byteorder=Endian.Little, wordorder=Endian.Big)
+    long_dc_ba = _make_decoder('i', byteorder=Endian.Little, wordorder=Endian.Little)
+    float_ab_cd = _make_decoder('f', byteorder=Endian.Big, wordorder=Endian.Big)
+    float_cd_ab = _make_decoder('f', byteorder=Endian.Big, wordorder=Endian.Little)
+    float_ba_dc = _make_decoder('f', byteorder=Endian.Little, wordorder=Endian.Big)
+    float_dc_ba = _make_decoder('f', byteorder=Endian.Little, wordorder=Endian.Little)
+    double_ab_cd_ef_gh = _make_decoder('d', byteorder=Endian.Big, wordorder=Endian.Big)
+    double_gh_ef_cd_ab = _make_decoder('d', byteorder=Endian.Big, wordorder=Endian.Little)
+    double_ba_dc_fe_hg = _make_decoder('d', byteorder=Endian.Little, wordorder=Endian.Big)
+    double_hg_fe_dc_ba = _make_decoder('d', byteorder=Endian.Little, wordorder=Endian.Little)
 
-        :param value: A list containing binary data to decode.
-        :type value: List
-        :return: Decoded data in 64-bit float format.
-        :rtype: float
-        """
-        return BinaryPayloadDecoder.fromRegisters(registers=value,
-                                                  byteorder=Endian.Little,
-                                                  wordorder=Endian.Little).decode_64bit_float()
 
 class Encoder:
     """
     A class for encoding various numerical data types as a list of pymodbus registers.
 
     .. note::
-        This class uses the `pymodbus` library to build the register list 
-        for the given numerical value.
+        Registers are built directly with `struct` and integer arithmetic, in the same layout 
+        `pymodbus` payload builders produce.
     """
     def __init__(self) -> None:
-        self._hex_ascii_pattern = re.compile(r'^0x[0-9a-fA-F]{1,4}$')
-        self._binary_pattern = re.compile(r'^[01]{4} [01]{4} [01]{4} [01]{4}$')
-
-    def _16bit_int(self, value: str, data_format: Dict) -> List[int]:
-        builder = BinaryPayloadBuilder(**data_format)
-        builder.add_16bit_int(int(value))
-        return builder.to_registers()
-
-    def _16bit_uint(self, value: str, data_format: Dict) -> List[int]:
-        builder = BinaryPayloadBuilder(**data_format)
-        builder.add_16bit_uint(int(value))
-        return builder.to_registers()
-
-    def _32bit_int(self, value: str, data_format: Dict) -> List[int]:
-        builder = BinaryPayloadBuilder(**data_format)
-        builder.add_32bit_int(int(value))
-        return builder.to_registers()
-
-    def _32bit_float(self, value: str, data_format: Dict) -> List[int]:
-        builder = BinaryPayloadBuilder(**data_format)
-        builder.add_32bit_float(float(value))
-        return builder.to_registers()
-
-    def _64bit_float(self, value: str, data_format: Dict) -> List[int]:
-        builder = BinaryPayloadBuilder(**data_format)
-        builder.add_64bit_float(float(value))
-        return builder.to_registers()
+        pass
+
+    def _16bit_int(self, value: str) -> List[int]:
+        # big-endian 16-bit register is the two's complement of the value
+        return [int(value) & 0xFFFF]
+
+    def _16bit_uint(self, value: str) -> List[int]:
+        return [int(value)]
 
     def signed(self, value: str) -> List[int]:
         """
@@ -283,8 +273,7 @@ class Encoder:
         :rtype: List[int]
         """
         if -32768 <= value <= 32767:
-            data_format: Dict = {'byteorder': Endian.Big, }
-            return self._16bit_int(value=value, data_format=data_format)
+            return self._16bit_int(value=value)
         return None
 
     def unsigned(self, value: str) -> List[int]:
@@ -297,8 +286,7 @@ class Encoder:
         :rtype: List[int]
         """
         if 0 <= value <= 65535:
-            data_format: Dict = {'byteorder': Endian.Big, }
-            return self._16bit_uint(value=value, data_format=data_format)
+            return self._16bit_uint(value=value)
         return None
 
     def hex_ascii(self, value: str) -> List[int]:
@@ -310,9 +298,9 @@ class Encoder:
         :return: list of registers.
         :rtype: List[int]
         """
-        if self._hex_ascii_pattern.match(value):
-            data_format: Dict = {'byteorder': Endian.Big, }
-            return self._16bit_uint(value=int(value, 16), data_format=data_format)
+        digits: str = value[2:]
+        if value[:2] == '0x' and 0 < len(digits) <= 4 and not digits.strip(string.hexdigits):
+            return self._16bit_uint(value=int(digits, 16))
         return None
 
     def binary(self, value: str) -> List[int]:
@@ -324,175 +312,21 @@ class Encoder:
         :return: list of registers.
         :rtype: List[int]
         """
-        if self._binary_pattern.match(value):
-            data_format: Dict = {'byteorder': Endian.Big, }
-            return self._16bit_uint(value=int(value.replace(' ', ''), 2), data_format=data_format)
+        digits: str = value.replace(' ', '')
+        if len(value) == 19 and value[4::5] == '   ' and len(digits) == 16 \
+                and not digits.strip('01'):
+            return self._16bit_uint(value=int(digits, 2))
         return None
 
-    def long_ab_cd(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit integer as a list of registers in the format AB-CD
-        (big-endian).
-
-        :param value: 32-bit integer.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Big,
-                             'wordorder': Endian.Big, }
-        return self._32bit_int(value=value, data_format=data_format)
-
-    def long_cd_ab(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit integer as a list of registers in the format CD-AB
-        (little-endian).
-
-        :param value: 32-bit integer.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Big,
-                             'wordorder': Endian.Little, }
-        return self._32bit_int(value=value, data_format=data_format)
-
-    def long_ba_dc(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit integer as a list of registers in the format BA-DC
-        (little-endian, swapped bytes).
-
-        :param value: 32-bit integer.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Little,
-                             'wordorder': Endian.Big, }
-        return self._32bit_int(value=value, data_format=data_format)
-
-    def long_dc_ba(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit integer as a list of registers in the format DC-BA
-        (little-endian, swapped words).
-
-        :param value: 32-bit integer.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Little,
-                             'wordorder': Endian.Little, }
-        return self._32bit_int(value=value, data_format=data_format)
-
-    def float_ab_cd(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit float as a list of registers in the format AB-CD
-        (big-endian).
-
-        :param value: 32-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Big,
-                             'wordorder': Endian.Big, }
-        return self._32bit_float(value=value, data_format=data_format)
-
-    def float_cd_ab(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit float as a list of registers in the format CD-AB
-        (little-endian).
-
-        :param value: 32-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Big,
-                             'wordorder': Endian.Little, }
-        return self._32bit_float(value=value, data_format=data_format)
-
-    def float_ba_dc(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit float as a list of registers in the format BA-DC
-        (little-endian, swapped bytes).
-
-        :param value: 32-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Little,
-                             'wordorder': Endian.Big, }
-        return self._32bit_float(value=value, data_format=data_format)
-
-    def float_dc_ba(self, value: str) -> List[int]:
-        """
-        Encodes 32-bit float as a list of registers in the format DC-BA
-        (little-endian, swapped words).
-
-        :param value: 32-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Little,
-                             'wordorder': Endian.Little, }
-        return self._32bit_float(value=value, data_format=data_format)
-
-    def double_ab_cd_ef_gh(self, value: str) -> List[int]:
-        """
-        Encodes 64-bit float as a list of registers in the format AB-CD-EF-GH
-        (big-endian).
-
-        :param value: 64-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Big,
-                             'wordorder': Endian.Big, }
-        return self._64bit_float(value=value, data_format=data_format)
-
-    def double_gh_ef_cd_ab(self, value: str) -> List[int]:
-        """
-        Encodes 64-bit float as a list of registers in the format GH-EF-CD-AB
-        (big-endian, swapped bytes).
-
-        :param value: 64-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Big,
-                             'wordorder': Endian.Little, }
-        return self._64bit_float(value=value, data_format=data_format)
-
-    def double_ba_dc_fe_hg(self, value: str) -> List[int]:
-        """
-        Encodes 64-bit float as a list of registers in the format BA-DC-FE-HG
-        (little-endian, swapped words).
-
-        :param value: 64-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Little,
-                             'wordorder': Endian.Big, }
-        return self._64bit_float(value=value, data_format=data_format)
-
-    def double_hg_fe_dc_ba(self, value: str) -> List[int]:
-        """
-        Encodes 64-bit float as a list of registers in the format HG-FE-DC-BA
-        (little-endian, swapped words).
-
-        :param value: 64-bit float.
-        :type value: str
-        :return: list of registers.
-        :rtype: List[int]
-        """
-        data_format: Dict = {'byteorder': Endian.Little,
-                             'wordorder': Endian.Little, }
-        return self._64bit_float(value=value, data_format=data_format)
+    long_ab_cd = _make_encoder('i', byteorder=Endian.Big, wordorder=Endian.Big)
+    long_cd_ab = _make_encoder('i', byteorder=Endian.Big, wordorder=Endian.Little)
+    long_ba_dc = _make_encoder('i', byteorder=Endian.Little, wordorder=Endian.Big)
+    long_dc_ba = _make_encoder('i', byteorder=Endian.Little, wordorder=Endian.Little)
+    float_ab_cd = _make_encoder('f', byteorder=Endian.Big, wordorder=Endian.Big)
+    float_cd_ab = _make_encoder('f', byteorder=Endian.Big, wordorder=Endian.Little)
+    float_ba_dc = _make_encoder('f', byteorder=Endian.Little, wordorder=Endian.Big)
+    float_dc_ba = _make_encoder('f', byteorder=Endian.Little, wordorder=Endian.Little)
+    double_ab_cd_ef_gh = _make_encoder('d', byteorder=Endian.Big, wordorder=Endian.Big)
+    double_gh_ef_cd_ab = _make_encoder('d', byteorder=Endian.Big, wordorder=Endian.Little)
+    double_ba_dc_fe_hg = _make_encoder('d', byteorder=Endian.Little, wordorder=Endian.Big)
+    double_hg_fe_dc_ba = _make_encoder('d', byteorder=Endian.Little, wordorder=Endian.Little)
@@ -13,14 +13,68 @@ __license__ = "MIT License"
 
 
 
+import copy
+import hashlib
 import traceback
-import uuid
-from typing import Dict, Tuple, List, Optional
-import yaml
+from operator import itemgetter
+from typing import Any, Dict, FrozenSet, Tuple, List, Optional, Set
 
 from utils.network import serial_ports
 
 
+# supported Modbus read functions, the second character is the function number
+_FUNCS: FrozenSet[str] = frozenset({'01 Read Coils',
+                                    '02 Read Discrete Inputs',
+                                    '03 Read Holding Registers',
+                                    '04 Read Input Registers', })
+
+# yaml module, loader and dumper, imported on first use
+_YAML: Optional[Tuple[Any, Any, Any]] = None
+
+# uuid5 hash state with the X500 namespace already fed in, created on first use
+_X500_SHA1: Optional[Any] = None
+
+# debug check of the unsaved changes flag against the configuration file, see Config.isChanged
+_CHECK_CHANGES: bool = False
+
+
+def _get_yaml() -> Tuple[Any, Any, Any]:
+    """
+    Imports yaml on first use and returns it with the fastest available safe loader and dumper.
+
+    :return: yaml module, loader class and dumper class.
+    :rtype: Tuple[Any, Any, Any]
+    """
+    global _YAML  # pylint: disable=global-statement
+    if _YAML is None:
+        # pylint: disable=import-outside-toplevel
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeLoader as Loader, SafeDumper as Dumper
+        _YAML = (yaml, Loader, Dumper)
+    return _YAML
+
+
+def _device_guid(data: Dict) -> str:
+    """
+    Returns the device GUID, uuid5 in the X500 namespace of the device connection parameters.
+
+    :param data: Device data with `protocol`, `interface`, `ip` and `address` keys.
+    :type data: Dict
+    :return: Device GUID.
+    :rtype: str
+    """
+    import uuid  # pylint: disable=import-outside-toplevel
+    global _X500_SHA1  # pylint: disable=global-statement
+    if _X500_SHA1 is None:
+        _X500_SHA1 = hashlib.sha1(uuid.NAMESPACE_X500.bytes)
+    sha1 = _X500_SHA1.copy()
+    sha1.update(f"{data['protocol']}{data['interface']}{data['ip']}{data['address']}".encode())
+    return str(uuid.UUID(bytes=sha1.digest()[:16], version=5))
+
+
 class Config:
     """
     A class that represents a configuration file.
@@ -32,6 +86,14 @@ class Config:
     :ivar _config: A dictionary that stores the configuration file.
     :ivar _serial: A dictionary that stores serial ports configuration.
     :ivar _devices: A dictionary that stores devices configuration.
+    :ivar _user_dirty: A flag that shows the configuration has unsaved changes.
+    :ivar _bindings: A dictionary that maps serial port names to GUIDs of the devices binded
+                     to them.
+    :ivar _codes: A dictionary that maps lowercased register codes to IDs of the registers
+                  using them.
+    :ivar _reg_by_id: A dictionary that maps register IDs to GUID of the device, function and
+                      address of the register.
+    :ivar _pollers: Cached result of `get_pollers`, None if it has to be rebuilt.
 
     :raises yaml.YAMLError: If the configuration file has YAML syntax errors.
 
@@ -40,28 +102,130 @@ class Config:
     """
     def __init__(self, path: str):
         self._path = path
-        self._config: Dict = self.get_config()
-        if not self._config:
-            self._config = {}
-
-        self._serial: Dict = {}
-
-        if 'network' not in self._config:
-            self._config['network'] = {}
-            self._config['network']['serial'] = {}
-            for serial in serial_ports():
-                self._serial[serial] = {'baud': None,
-                                        'bits': None,
-                                        'parity': None,
-                                        'stop': None, }
-        else:
-            self._serial: Dict = self._config['network']['serial']
-
-        if 'devices' not in self._config:
-            self._config['devices'] = {}
-        self._config['devices']: Dict = self._config['devices']
+        loaded: Optional[Dict] = self.get_config()
+        self._config: Dict = copy.deepcopy(loaded) if loaded else {}
+
+        network: Dict = self._config.setdefault('network', {})
+        if network.get('serial') is None:
+            # портов в конфиге нет - берем найденные в системе
+            network['serial'] = {serial: {'baud': None,
+                                          'bits': None,
+                                          'parity': None,
+                                          'stop': None, }
+                                 for serial in serial_ports()}
+        self._serial: Dict = network['serial']
+
+        self._config.setdefault('devices', {})
         # print(json.dumps(self._config, indent=2))
 
+        # добавленные при загрузке разделы в файле еще не сохранены
+        self._user_dirty: bool = self._config != loaded
+        self._pollers: Optional[Dict] = None
+        self._bindings: Dict[str, Set[str]] = {}
+        self._codes: Dict[str, Set[str]] = {}
+        self._reg_by_id: Dict[str, Tuple[str, str, str]] = {}
+        for guid, device in self._config['devices'].items():
+            self._bind(guid, device['interface'])
+            self._index_device(guid, device)
+
+    def _touch(self) -> None:
+        """
+        Marks the configuration as having unsaved changes, so the next `get_pollers` call
+        rebuilds the pollers.
+
+        :return: nothing
+        :rtype: None
+        """
+        self._user_dirty = True
+        self._pollers = None
+
+    def _bind(self, guid: str, interface: Optional[str]) -> None:
+        """
+        Registers the device with the given GUID as binded to the given serial interface.
+
+        :param guid: GUID of the device.
+        :type guid: str
+        :param interface: Serial interface name, None for network devices.
+        :type interface: Optional[str]
+        :return: nothing
+        :rtype: None
+        """
+        if interface:
+            self._bindings.setdefault(interface, set()).add(guid)
+
+    def _unbind(self, guid: str, interface: Optional[str]) -> None:
+        """
+        Removes the device with the given GUID from the devices binded to the given interface.
+
+        :param guid: GUID of the device.
+        :type guid: str
+        :param interface: Serial interface name, None for network devices.
+        :type interface: Optional[str]
+        :return: nothing
+        :rtype: None
+        """
+        guids: Optional[Set[str]] = self._bindings.get(interface)
+        if guids:
+            guids.discard(guid)
+            if not guids:
+                del self._bindings[interface]
+
+    def _index_register(self, guid: str, func: str, addr: str, register: Dict) -> None:
+        """
+        Adds the given register to the codes and register IDs indexes.
+
+        :param guid: GUID of the device the register belongs to.
+        :type guid: str
+        :param func: The function of the register.
+        :type func: str
+        :param addr: The address of the register.
+        :type addr: str
+        :param register: Register data.
+        :type register: Dict
+        :return: nothing
+        :rtype: None
+        """
+        self._codes.setdefault(register['code'].lower(), set()).add(register['id'])
+        self._reg_by_id[register['id']] = (guid, func, addr)
+
+    def _unindex_register(self, register: Dict) -> None:
+        """
+        Removes the given register from the codes and register IDs indexes.
+
+        :param register: Register data.
+        :type register: Dict
+        :return: nothing
+        :rtype: None
+        """
+        code: str = register['code'].lower()
+        reg_ids: Optional[Set[str]] = self._codes.get(code)
+        if reg_ids:
+            reg_ids.discard(register['id'])
+            if not reg_ids:
+                del self._codes[code]
+        self._reg_by_id.pop(register['id'], None)
+
+    def _index_device(self, guid: str, device: Dict, remove: bool = False) -> None:
+        """
+        Adds all registers of the given device to the indexes or removes them.
+
+        :param guid: GUID of the device.
+        :type guid: str
+        :param device: Device data.
+        :type device: Dict
+        :param remove: Remove the registers instead of adding them, defaults to False
+        :type remove: bool, optional
+        :return: nothing
+        :rtype: None
+        """
+        for func, registers in (device.get('registers') or {}).items():
+            for addr, register in (registers or {}).items():
+                if register:
+                    if remove:
+                        self._unindex_register(register)
+                    else:
+                        self._index_register(guid, func, addr, register)
+
     def get_config(self) -> Dict:
         """
         Loads and returns the configuration file.
@@ -69,12 +233,15 @@ class Config:
         :return: A dictionary that represents the configuration file
         :rtype: Dict
         """
-        with open(self._path, "r", encoding='utf8') as stream:
-            try:
-                return yaml.safe_load(stream)
-            except yaml.YAMLError as e:
-                print(e)
-                return None
+        with open(self._path, "rb", buffering=1 << 16) as stream:
+            content: bytes = stream.read()
+        yaml, loader, _ = _get_yaml()
+        try:
+            # libyaml decodes UTF-8 itself
+            return yaml.load(content, Loader=loader)
+        except yaml.YAMLError as e:
+            print(e)
+            return None
 
     def set_serial_value(self, serial: str, parameter:str, value: str) -> None:
         """
@@ -93,6 +260,7 @@ class Config:
         if serial not in self._serial:
             self._serial[serial] = {}
         self._serial[serial][parameter.lower()] = value
+        self._touch()
         return True
 
     def delete_serial(self, serial: str) -> None:
@@ -104,11 +272,9 @@ class Config:
         :return:        nothing
         :rtype:         None
         """
-        if serial in self._serial.keys():
+        if serial in self._serial:
             self._serial.pop(serial)
-            print(True)
-        else:
-            print(False)
+            self._touch()
 
     def get_devices_data(self) -> List[List]:
         """
@@ -122,15 +288,13 @@ class Config:
                     - interface
         :rtype:     List[List]
         """
-        result: List = []
-        if self._config['devices']:
-            for key, value in self._config['devices'].items():
-                result.append((key,
-                               value['name'],
-                               value['protocol'],
-                               value['active'],
-                               value['interface'],))
-        return sorted(result, key=lambda x: x[1])
+        return sorted(((key,
+                         value['name'],
+                         value['protocol'],
+                         value['active'],
+                         value['interface'],)
+                        for key, value in (self._config['devices'] or {}).items()),
+                      key=itemgetter(1))
 
     def get_device_data(self, guid: str) -> Optional[Dict]:
         """
@@ -138,7 +302,6 @@ class Config:
 
         :param guid:        The GUID of the device to retrieve information for.
         :type guid:         str
-        :raises ValueError: If the specified GUID is not found in the configuration.
         :return:            A dictionary containing the device information if the GUID is found,
                             otherwise None.
         :rtype:             Optional[Dict]
@@ -177,16 +340,10 @@ class Config:
             }
         }
         """
-        try:
-            if guid in self._config['devices'].keys():
-                return self._config['devices'][guid]
-            raise ValueError(
-                'Error@Config.get_device_data.',
-                f'Переданный guid {guid} не найден в конфиге'
-            )
-        except ValueError as e:
-            print(f'{type(e).__name__} occurred, args={str(e.args)}\n{traceback.format_exc()}')
-            return None
+        device: Optional[Dict] = self._config['devices'].get(guid)
+        if device is None:
+            print('Error@Config.get_device_data.', f'Переданный guid {guid} не найден в конфиге')
+        return device
 
     def create_device_data(self, data: Dict) -> Optional[str]:
         """
@@ -202,17 +359,16 @@ class Config:
                     returns a string indicating that the device already exists.
         :rtype:     Optional[str]
         """
-        guid: str = str(
-            uuid.uuid5(uuid.NAMESPACE_X500,
-                       f"{data['protocol']}{data['interface']}{data['ip']}{data['address']}"))
-        if self._config['devices']:
-            if guid in self._config['devices'].keys():
-                return 'Устройство с такими параметрами уже существует.'
-        else:
-            self._config['devices'] = {}
-        # self._config['devices'][guid] = data
-        self._config['devices'][guid] = data
-        print('self._config--->>>', self._config)
+        guid: str = _device_guid(data)
+        devices: Optional[Dict] = self._config['devices']
+        if devices is None:
+            devices = self._config['devices'] = {}
+        elif guid in devices:
+            return 'Устройство с такими параметрами уже существует.'
+        devices[guid] = data
+        self._bind(guid, data['interface'])
+        self._index_device(guid, data)
+        self._touch()
         return None
 
     def change_device_data(self, guid: str, data: Dict) -> Optional[str]:
@@ -223,37 +379,40 @@ class Config:
         :type guid:         str
         :param data:        A dictionary containing the updated device data.
         :type data:         Dict
-        :raises ValueError: If the given `guid` is not found in the config.
-        :raises ValueError: If device with the provided parameters already exists 
         :return:            Returns `None` if the device data is updated successfully, 
-                            otherwise returns an error message.
+                            otherwise returns an error message: the given `guid` is not found
+                            in the config or device with the provided parameters already exists.
         :rtype:             Optional[str]
         """
         result: Optional[str] = None
-        rehashed_guid: str = str(
-            uuid.uuid5(uuid.NAMESPACE_X500,
-                       f"{data['protocol']}{data['interface']}{data['ip']}{data['address']}"))
-        try:
-            if guid == rehashed_guid:
-                if guid in self._config['devices'].keys():
-                    self._config['devices'][guid].update(data)
+        rehashed_guid: str = _device_guid(data)
+        devices: Dict = self._config['devices']
+        if guid == rehashed_guid:
+            device: Optional[Dict] = devices.get(guid)
+            if device is not None:
+                if all(device.get(key) == value for key, value in data.items()):
+                    # изменений нет
                     return None
-                result = f'Переданный guid {guid} не найден в конфиге'
-                raise ValueError(
-                    'Error@Config.change_device_data.',
-                    result
-                )
-            if rehashed_guid in self._config['devices'].keys():
-                result = 'Устройство с такими параметрами уже существует.'
-                raise ValueError(
-                    'Error@Config.change_device_data.',
-                    result
-                )
-            self._config['devices'][rehashed_guid] = self._config['devices'].pop(guid)
-            self._config['devices'][rehashed_guid].update(data)
-        except ValueError as e:
-            print(f'{type(e).__name__} occurred, args={str(e.args)}\n{traceback.format_exc()}')
+                self._unbind(guid, device['interface'])
+                device.update(data)
+                self._bind(guid, data['interface'])
+                self._touch()
+                return None
+            result = f'Переданный guid {guid} не найден в конфиге'
+        elif rehashed_guid in devices:
+            result = 'Устройство с такими параметрами уже существует.'
+        if result:
+            print('Error@Config.change_device_data.', result)
             return result
+
+        device = devices.pop(guid)
+        self._unbind(guid, device['interface'])
+        self._index_device(guid, device, remove=True)
+        device.update(data)
+        devices[rehashed_guid] = device
+        self._index_device(rehashed_guid, device)
+        self._bind(rehashed_guid, data['interface'])
+        self._touch()
         return None
 
     def delete_device_data(self, guid: str) -> None:
@@ -265,7 +424,10 @@ class Config:
         :return:    nothing
         :rtype:     None
         """
-        self._config['devices'].pop(guid)
+        device: Dict = self._config['devices'].pop(guid)
+        self._unbind(guid, device['interface'])
+        self._index_device(guid, device, remove=True)
+        self._touch()
 
     def change_device_activity(self, guid: str) -> None:
         """
@@ -276,7 +438,9 @@ class Config:
         :return:        nothing
         :rtype:         None
         """
-        self._config['devices'][guid]['active'] = not self._config['devices'][guid]['active']
+        device: Dict = self._config['devices'][guid]
+        device['active'] = not device['active']
+        self._touch()
 
     def get_device_registers_data(self, guid: str) -> List[Tuple]:
         """
@@ -296,32 +460,26 @@ class Config:
                     - register id
         :rtype: List[Tuple]
         """
-        registers = self.get_device_data(guid)['registers']
-        funcs: List = ['01 Read Coils',
-                       '02 Read Discrete Inputs',
-                       '03 Read Holding Registers',
-                       '04 Read Input Registers', ]
+        registers: Dict = self._config['devices'][guid]['registers'] or {}
+        for func, func_registers in registers.items():
+            if func_registers and func not in _FUNCS:
+                raise ValueError(
+                    'Error@Config.get_device_registers.',
+                    f'Полученной из конфига функции {func} нет в func_dict'
+                )
 
-        data: List[Tuple] = []
-        if registers:
-            for func, func_registers in registers.items():
-                if func_registers:
-                    if func in funcs:
-                        for reg_addr, reg_data in func_registers.items():
-                            data.append((func,
-                                         int(func[1:2]),
-                                         reg_addr,
-                                         reg_data['format'],
-                                         reg_data['code'],
-                                         reg_data['name'],
-                                         reg_data['active'],
-                                         reg_data['id'], ))
-                    else:
-                        raise ValueError(
-                            'Error@Config.get_device_registers.',
-                            f'Полученной из конфига функции {func} нет в func_dict'
-                        )
-        return sorted(data)
+        # function and address identify a register, so the rest of the tuple is never compared
+        return sorted(((func,
+                        ord(func[1]) - 48,
+                        reg_addr,
+                        reg_data['format'],
+                        reg_data['code'],
+                        reg_data['name'],
+                        reg_data['active'],
+                        reg_data['id'], )
+                       for func, func_registers in registers.items() if func_registers
+                       for reg_addr, reg_data in func_registers.items()),
+                      key=itemgetter(0, 2))
 
     def get_device_register_data(self, 
                                  guid: str, 
@@ -343,25 +501,14 @@ class Config:
         :rtype: Optional[Dict]
         """
         device_data = self.get_device_data(guid)
-        # if `func` provided
-        if func:
-            # if `addr` provided
-            if addr:
-                return device_data['registers'].get(func, {}).get(addr)
-            # if `addr` is not provided
-            for register in device_data['registers'].get(func, {}).values():
-                if register['id'] == reg_id:
-                    return register
-        # if `addr` provided without `func`
-        if addr:
-            for registers in device_data['registers'].values():
-                if registers.get(addr, {}).get('id') == reg_id:
-                    return registers[addr]
-        # if nothing provided
-        for registers in device_data['registers'].values():
-            for register in registers.values():
-                if register['id'] == reg_id:
-                    return register
+        # if `func` and `addr` provided
+        if func and addr:
+            return device_data['registers'].get(func, {}).get(addr)
+        # otherwise search by `reg_id`
+        location: Optional[Tuple[str, str, str]] = self._reg_by_id.get(reg_id)
+        if location and location[0] == guid:
+            _, reg_func, reg_addr = location
+            return device_data['registers'][reg_func][reg_addr]
         return None
 
     def create_register(self, guid: str, func: str, addr: int, data: Dict) -> bool:
@@ -382,16 +529,20 @@ class Config:
         :rtype:             bool
         """
         registers = self._config['devices'][guid]['registers']
-        if registers[func]:
-            if addr in registers[func]:
+        func_registers: Optional[Dict] = registers[func]
+        if func_registers:
+            if addr in func_registers:
                 raise ValueError(
                     'Error@Config.create_register.',
                     f'Регистр с номером {addr} в функции {func} устройства {guid} уже существует.'
                 )
         else:
-            registers[func] = {}
+            func_registers = registers[func] = {}
+        import uuid  # pylint: disable=import-outside-toplevel
         data['id'] = str(uuid.uuid4())
-        registers[func][addr] = data
+        func_registers[addr] = data
+        self._index_register(guid, func, addr, data)
+        self._touch()
         return True
 
     def update_register(self, guid: str, func: str, addr: int, data: Dict) -> bool:
@@ -414,35 +565,28 @@ class Config:
         :rtype:             bool
         """
         registers = self._config['devices'][guid]['registers']
-        if not registers[func]:
-            registers[func] = {}
-        if addr not in registers[func]:
-            registers[func][addr] = {}
-        else:
-            if data['id'] != registers[func][addr]['id']:
+        func_registers: Optional[Dict] = registers[func]
+        if not func_registers:
+            func_registers = registers[func] = {}
+        register: Optional[Dict] = func_registers.get(addr)
+        if register is not None:
+            if data['id'] != register['id']:
                 raise ValueError(
                     'Error@Config.update_register.',
                     f'Регистр с номером {addr} в функции {func} устройства {guid} уже существует.'
                 )
-            if registers[func][addr] == data:
-                print(
-                    'Изменения не были  внесены.', 'data', data, 'register', registers[func][addr]
-                )
+            if register == data:
+                # изменения не были внесены
                 return False
 
-        reg_addr_to_delete = ''
-        for registers in self._config['devices'][guid]['registers'].values():
-            if registers:
-                for reg_addr, reg_data in registers.items():
-                    if reg_data:
-                        if reg_data['id'] == data['id']:
-                            reg_addr_to_delete = reg_addr
-                            break
-                if reg_addr_to_delete:
-                    del registers[reg_addr_to_delete]
-                    break
-
-        self._config['devices'][guid]['registers'][func][addr] = data
+        location: Optional[Tuple[str, str, str]] = self._reg_by_id.get(data['id'])
+        if location and location[0] == guid:
+            _, reg_func, reg_addr = location
+            self._unindex_register(registers[reg_func].pop(reg_addr))
+
+        func_registers[addr] = data
+        self._index_register(guid, func, addr, data)
+        self._touch()
         return True
 
     def delete_register(self, guid: str, func: str, addr: str, reg_id: str) -> Optional[bool]:
@@ -461,11 +605,12 @@ class Config:
                         None if the register was not found in the configuration.
         :rtype:         Optional[bool]
         """
-        if self._config['devices'][guid]['registers'][func]:
-            registers = self._config['devices'][guid]['registers'][func]
+        registers: Optional[Dict] = self._config['devices'][guid]['registers'][func]
+        if registers:
             if addr in registers:
                 if registers[addr]['id'] == reg_id:
-                    self._config['devices'][guid]['registers'][func].pop(addr)
+                    self._unindex_register(registers.pop(addr))
+                    self._touch()
                     return True
                 # TODO `raise Exception` pylint: disable=fixme
         return None
@@ -487,25 +632,29 @@ class Config:
                         toggled, False otherwise.
         :rtype:         bool
         """
-        if self._config['devices'][guid]['registers'][func]:
-            if addr in self._config['devices'][guid]['registers'][func]:
-                register = self._config['devices'][guid]['registers'][func][addr]
+        registers: Optional[Dict] = self._config['devices'][guid]['registers'][func]
+        if registers:
+            if addr in registers:
+                register = registers[addr]
                 if register['id'] == reg_id:
-                    register = self._config['devices'][guid]['registers'][func][addr]
                     register['active'] = not register['active']
+                    self._touch()
                     return True
                 # raise Exception
         return False
 
     def isChanged(self) -> bool:
         """
-        Check if the current config has been changed from the original configuration.
+        Check if the current config has been changed since it was loaded or saved.
 
-        :return:    A boolean value indicating if the current config has been changed from 
-                    the original configuration.
+        :return:    A boolean value indicating if the current config has unsaved changes.
         :rtype:     bool
         """
-        return not self.get_config() == self._config
+        if _CHECK_CHANGES:
+            # без несохраненных изменений конфигурация совпадает с файлом
+            assert self._user_dirty or self.get_config() == self._config, \
+                'Error@Config.isChanged: the configuration differs from the file.'
+        return self._user_dirty
 
     def serial_is_binded(self, serial: str) -> bool:
         """
@@ -516,10 +665,7 @@ class Config:
         :return: `True` if any device is binded to the given `serial`, `False` otherwise.
         :rtype: bool
         """
-        for device in self._config['devices'].values():
-            if serial == device['interface']:
-                return True
-        return False
+        return bool(self._bindings.get(serial))
 
     def check_code_unique(self, code: str, reg_id: str = None) -> bool:
         """
@@ -532,17 +678,17 @@ class Config:
         :return: True if the code is unique, False otherwise.
         :rtype: bool
         """
-        code_list = [register['code'].lower() for device in self._config['devices'].values()
-                     for registers in device['registers'].values() if registers
-                     for register in registers.values() if reg_id != register['id']]
-
-        return code.lower() in code_list
+        reg_ids: Optional[Set[str]] = self._codes.get(code.lower())
+        return bool(reg_ids) and any(reg_id != _id for _id in reg_ids)
 
     def get_pollers(self) -> Dict:
         """
         Returns a dictionary containing all active devices and their respective poller settings
         and registers.
 
+        The result is cached until the configuration is modified, so it must not be changed by
+        the caller.
+
         :return: A dictionary containing device poller settings and their respective registers.
         :rtype: Dict
 
@@ -601,6 +747,9 @@ class Config:
             }
         }
         """
+        if self._pollers is not None:
+            return self._pollers
+
         result: Dict = {}
         for guid, device in self._config['devices'].items():
             if not device['active']:
@@ -611,19 +760,19 @@ class Config:
             for func, raw_registers in device['registers'].items():
                 if not raw_registers:
                     continue
-                index = int(func[1])
-                registers[index] = [register for addr, raw_register in raw_registers.items() if
-                                    raw_register['active'] and (register := {
-                                        'device': device['name'],
-                                        'guid': guid,
-                                        'address': addr,
-                                        'id': raw_register['id'],
-                                        'code': raw_register['code'],
-                                        'name': raw_register['name'],
-                                        'format': raw_register['format'],
-                                        'adjustments': raw_register['adjustments']
-                                    })]
-                registers[index] = sorted(registers[index], key=lambda d: d['address'])
+                index = ord(func[1]) - 48
+                # адреса - ключи словаря, поэтому сортируем пары до сборки регистров
+                registers[index] = [{'device': device['name'],
+                                     'guid': guid,
+                                     'address': addr,
+                                     'id': raw_register['id'],
+                                     'code': raw_register['code'],
+                                     'name': raw_register['name'],
+                                     'format': raw_register['format'],
+                                     'adjustments': raw_register['adjustments']}
+                                    for addr, raw_register in sorted(raw_registers.items(),
+                                                                     key=itemgetter(0))
+                                    if raw_register['active']]
             
             # get poller's connection settings
             serial: Dict = self._serial.get(device['interface'], {})
@@ -642,6 +791,7 @@ class Config:
             result[guid] = {'name': device['name'],
                             'settings': settings,
                             'registers': registers}
+        self._pollers = result
         return result
 
     def save_to_file(self) -> bool:
@@ -652,10 +802,13 @@ class Config:
         :rtype: bool
         """
         result: bool = False
+        yaml, _, dumper = _get_yaml()
         try:
-            with open(self._path, "w", encoding='utf8') as stream:
-                yaml.dump(self._config, stream, allow_unicode=True)
+            with open(self._path, "w", encoding='utf8', buffering=1 << 16) as stream:
+                yaml.dump(self._config, stream, Dumper=dumper, allow_unicode=True,
+                          default_flow_style=False, width=4096)
             result = True
-        except yaml.YAMLError as e:
+            self._user_dirty = False
+        except (OSError, yaml.YAMLError) as e:
             print(f'{type(e).__name__} occurred, args={str(e.args)}\n{traceback.format_exc()}')
         return result
@@ -1,6 +1,11 @@
 """
 This module provides with class for polling devices via Modbus.
 
+The Modbus exchange is done with asyncio pymodbus clients on a single event loop shared by all 
+the pollers and running in its own thread (see AsyncPollerHost), so that independent requests of 
+one poll cycle, and the polls of different devices, can be in flight simultaneously without 
+a thread per device. Public methods stay synchronous and can be called from any other thread, 
+coroutines running on the shared loop use their `_async` counterparts.
 """
 
 __author__ = "Ilya Molodkin"
@@ -9,9 +14,17 @@ __version__ = "1.0"
 __license__ = "MIT License"
 
 
+import asyncio
+import concurrent.futures
+import socket
+import threading
+import time
 import traceback
-from datetime import datetime
-from typing import Optional, Dict, List, Any, Union
+from functools import lru_cache
+from operator import add, mul, sub, truediv
+from types import MappingProxyType
+from typing import (Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, 
+                    Union)
 
 # import memory_profiler
 # from guppy import hpy
@@ -25,6 +38,196 @@ from utils.coders import Decoder, Encoder
 from utils.utils import isNumerical
 
 
+# Имена методов Decoder/Encoder для каждого формата данных
+_FORMAT_METHODS: Dict[str, str] = {'Signed': 'signed',
+                                   'Unsigned': 'unsigned',
+                                   'Hex - ASCII': 'hex_ascii',
+                                   'Binary': 'binary',
+                                   'Long AB CD': 'long_ab_cd',
+                                   'Long CD AB': 'long_cd_ab',
+                                   'Long BA DC': 'long_ba_dc',
+                                   'Long DC BA': 'long_dc_ba',
+                                   'Float AB CD': 'float_ab_cd',
+                                   'Float CD AB': 'float_cd_ab',
+                                   'Float BA DC': 'float_ba_dc',
+                                   'Float DC BA': 'float_dc_ba',
+                                   'Double AB CD EF GH': 'double_ab_cd_ef_gh',
+                                   'Double GH EF CD AB': 'double_gh_ef_cd_ab',
+                                   'Double BA DC FE HG': 'double_ba_dc_fe_hg',
+                                   'Double HG FE DC BA': 'double_hg_fe_dc_ba', }
+# Прямая и обратная операции для арифметических преобразований значения
+_OPERATIONS: Dict[str, Tuple[Callable, Callable]] = {'+': (add, sub),
+                                                     '-': (sub, add),
+                                                     '*': (mul, truediv),
+                                                     '/': (truediv, mul),
+                                                     '^': (pow, lambda value, n: value ** (1 / n))}
+# Извлечение значений из ответа на запрос чтения: биты для функций 1 и 2, регистры для 3 и 4.
+# Список регистров ответа используется как есть, без копирования.
+_EXTRACTORS: Dict[int, Callable[[ModbusResponse, int], List]] = {
+    1: lambda response, count: response.bits[:count],
+    2: lambda response, count: response.bits[:count],
+    3: lambda response, count: response.registers,
+    4: lambda response, count: response.registers, }
+# Максимальное количество регистров (битов для функций 1 и 2) в одном запросе
+_MAX_QUANTITY: Dict[int, int] = {1: 2000, 2: 2000, 3: 125, 4: 125}
+
+
+@lru_cache(maxsize=1024)
+def _compile_adjustments(key: Tuple) -> Tuple[Tuple[Optional[Callable], Optional[Callable], 
+                                                     Any, Any], ...]:
+    """
+    Converts adjustments to operation functions and numerical operands once.
+
+    :param key: Adjustments as a tuple of (operator, operand) pairs.
+    :type key: Tuple
+    :return: A tuple of (operation, reverse operation, number, operand). For a value substitution 
+             both operations are None and the number is the value to be substituted; otherwise 
+             the number is None if the operand is not numerical. Unknown operators are skipped.
+    :rtype: Tuple[Tuple[Optional[Callable], Optional[Callable], Any, Any], ...]
+    """
+    compiled: List = []
+    for operator, operand in key:
+        if operator.isdigit():
+            compiled.append((None, None, int(operator), operand))
+            continue
+        if operator not in _OPERATIONS:
+            continue
+        try:
+            number: Optional[float] = float(operand)
+        except (TypeError, ValueError):
+            number = None
+        compiled.append((*_OPERATIONS[operator], number, operand))
+    return tuple(compiled)
+
+
+def _adjustments(adjustments: List) -> Tuple[Tuple[Optional[Callable], Optional[Callable], 
+                                                  Any, Any], ...]:
+    key: Tuple = tuple(item for adjustment in adjustments for item in adjustment.items())
+    try:
+        return _compile_adjustments(key)
+    except TypeError:
+        # Нехешируемый операнд - обходимся без кэша
+        return _compile_adjustments.__wrapped__(key)
+
+
+def _affine(compiled: Tuple) -> Optional[Callable]:
+    """
+    Folds the adjustments into a single expression when they are a scaling, an offset, or a 
+    scaling followed by an offset, with numerical operands.
+
+    Only the shapes whose folded expression gives exactly the same float as applying the 
+    operations one by one are folded.
+
+    :param compiled: Adjustments converted by `_compile_adjustments`.
+    :type compiled: Tuple
+    :return: A function applying the adjustments to a decoded value, or None if the adjustments 
+             cannot be folded.
+    :rtype: Optional[Callable]
+    """
+    if not 0 < len(compiled) <= 2 or any(operation is None or number is None 
+                                         for operation, _, number, _ in compiled):
+        return None
+    scaling: Optional[Tuple] = None
+    offset: Optional[float] = None
+    for index, (operation, _, number, _) in enumerate(compiled):
+        if operation in (mul, truediv) and index == 0:
+            scaling = (operation, number)
+        elif operation in (add, sub) and index == len(compiled) - 1:
+            # x - b и x + (-b) дают одинаковый результат
+            offset = number if operation is add else -number
+        else:
+            return None
+    if scaling is not None and scaling[0] is truediv and scaling[1] == 0:
+        # деление на ноль обрабатывается общим путём
+        return None
+
+    if scaling is None:
+        expression: Callable = lambda value: value + offset
+    elif scaling[0] is mul:
+        factor: float = scaling[1]
+        expression = ((lambda value: value * factor) if offset is None 
+                      else (lambda value: value * factor + offset))
+    else:
+        divisor: float = scaling[1]
+        expression = ((lambda value: value / divisor) if offset is None 
+                      else (lambda value: value / divisor + offset))
+
+    def adjust(value: Any) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        return f"{expression(float(value)):.2f}"
+    return adjust
+
+
+class AsyncPollerHost:
+    """
+    Owns the event loop all the pollers run their Modbus exchange on. The loop runs forever in 
+    a daemon thread, so that sockets of all the devices are waited for by one selector.
+
+    :ivar loop: The shared event loop.
+    :type loop: asyncio.AbstractEventLoop
+    :ivar _thread: The thread running the loop.
+    :type _thread: threading.Thread
+    """
+    _instance: Optional['AsyncPollerHost'] = None
+    _instance_lock: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+        self._thread: threading.Thread = threading.Thread(target=self._run_forever, 
+                                                          name='modbus-io', 
+                                                          daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def instance(cls) -> 'AsyncPollerHost':
+        """
+        Returns the shared host, starting it on first use.
+
+        :return: The shared host.
+        :rtype: AsyncPollerHost
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def _run_forever(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def in_loop_thread(self) -> bool:
+        """
+        Returns whether the caller runs in the thread of the shared loop.
+
+        :return: True if called from the loop thread, False otherwise.
+        :rtype: bool
+        """
+        return threading.current_thread() is self._thread
+
+    def submit(self, coroutine: Awaitable) -> concurrent.futures.Future:
+        """
+        Schedules a coroutine on the shared loop.
+
+        :param coroutine: The coroutine to run.
+        :type coroutine: Awaitable
+        :return: A future holding the result of the coroutine.
+        :rtype: concurrent.futures.Future
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call_soon(self, callback: Callable, *args: Any) -> None:
+        """
+        Calls a function on the shared loop from any thread.
+
+        :param callback: The function to call.
+        :type callback: Callable
+        :return: nothing
+        :rtype: None
+        """
+        self.loop.call_soon_threadsafe(callback, *args)
+
+
 class Poller:
     """
     A class for polling data from a Modbus device.
@@ -32,49 +235,80 @@ class Poller:
     :param settings: A dictionary of settings for the Modbus connection.
     :type settings: Dict
 
-    :ivar reg_len: A dictionary of register lengths for various data types.
-    :type reg_len: Dict
+    :cvar reg_len: A read-only mapping of register lengths for various data types.
+    :type reg_len: Mapping[str, int]
     :ivar _modbus: A modbus instance for the Modbus connection.
     :type _modbus: modbus
     :ivar _scan_rate: The scan rate for polling data from the Modbus device in milliseconds.
     :type _scan_rate: int
     :ivar _settings: A dictionary of settings for the Modbus connection.
     :type _settings: Dict
+    :ivar _slave_id: The Modbus address of the device.
+    :type _slave_id: int
     :ivar _connection: The Modbus connection object.
-    :type _connection: Optional[Union[self._modbus.ModbusTcpClient, 
-                                      self._modbus.ModbusSerialClient]]
+    :type _connection: Optional[Union[self._modbus.AsyncModbusTcpClient, 
+                                      self._modbus.AsyncModbusSerialClient]]
+    :ivar _read_methods: Read methods of the connection by function code.
+    :type _read_methods: Dict[int, Callable]
+    :ivar host: The host of the event loop the Modbus exchange runs on.
+    :type host: AsyncPollerHost
+    :ivar _lock: A lock serializing polls and writes of the poller on the shared loop, created on 
+                 first use.
+    :type _lock: Optional[asyncio.Lock]
     :ivar _requests: A dictionary of requests sent to the Modbus device.
     :type _requests: Dict 
+    :ivar _plan: Requests prepared for polling: function code, address and quantity as ints, 
+                 for each register its position in the response, length, decode method, 
+                 adjustment function and row data, and runs of registers of the same format 
+                 which are decoded at once.
+    :type _plan: List[Tuple[int, int, int, Tuple, Tuple]]
+    :ivar _row_count: The number of registers in the plan.
+    :type _row_count: int
+    :ivar _raw_cache: Raw registers and decoded values of each request from the previous poll.
+    :type _raw_cache: Dict[Tuple[int, int, int], Tuple[List, List]]
     :ivar _decoder: A Decoder instance.
     :type _decoder: Decoder 
 
     :return: An instance of the Poller class.
     """
+    reg_len: Mapping[str, int] = MappingProxyType({'Signed': 1,
+                                                   'Unsigned': 1,
+                                                   'Hex - ASCII': 1,
+                                                   'Binary': 1,
+                                                   'Long AB CD': 2,
+                                                   'Long CD AB': 2,
+                                                   'Long BA DC': 2,
+                                                   'Long DC BA': 2,
+                                                   'Float AB CD': 2,
+                                                   'Float CD AB': 2,
+                                                   'Float BA DC': 2,
+                                                   'Float DC BA': 2,
+                                                   'Double AB CD EF GH': 4,
+                                                   'Double GH EF CD AB': 4,
+                                                   'Double BA DC FE HG': 4,
+                                                   'Double HG FE DC BA': 4, })
+
     def __init__(self, settings: Dict) -> None:
-        self.reg_len: Dict = {'Signed': 1,
-                                  'Unsigned': 1,
-                                  'Hex - ASCII': 1,
-                                  'Binary': 1,
-                                  'Long AB CD': 2,
-                                  'Long CD AB': 2,
-                                  'Long BA DC': 2,
-                                  'Long DC BA': 2,
-                                  'Float AB CD': 2,
-                                  'Float CD AB': 2,
-                                  'Float BA DC': 2,
-                                  'Float DC BA': 2,
-                                  'Double AB CD EF GH': 4,
-                                  'Double GH EF CD AB': 4,
-                                  'Double BA DC FE HG': 4,
-                                  'Double HG FE DC BA': 4, }
         self._modbus: modbus = modbus
-        self._settings: Dict = settings
+        self._settings: Dict = dict(settings)
         self._settings['scan_rate'] = 1000
-        self._connection: Optional[Union[self._modbus.ModbusTcpClient, 
-                                         self._modbus.ModbusSerialClient]] = None
+        self._slave_id: int = (self._settings['slave_id'] 
+                               if self._settings.get('slave_id') is not None else 1)
+        self._connection: Optional[Union[self._modbus.AsyncModbusTcpClient, 
+                                         self._modbus.AsyncModbusSerialClient]] = None
+        self._read_methods: Dict[int, Callable] = {}
+        self.host: AsyncPollerHost = AsyncPollerHost.instance()
+        self._lock: Optional[asyncio.Lock] = None
         self._requests: Dict = {}
+        self._plan: List[Tuple[int, int, int, Tuple, Tuple]] = []
+        self._row_count: int = 0
+        self._raw_cache: Dict[Tuple[int, int, int], Tuple[List, List]] = {}
         self._decoder: Decoder = Decoder()
+        self._decode_dispatch: Dict = {fmt: getattr(self._decoder, name) 
+                                       for fmt, name in _FORMAT_METHODS.items()}
         self._encoder: Encoder = Encoder()
+        self._encode_dispatch: Dict = {fmt: getattr(self._encoder, name) 
+                                       for fmt, name in _FORMAT_METHODS.items()}
 
     @property
     def scan_rate(self) -> Optional[int]:
@@ -99,6 +333,90 @@ class Poller:
         """
         self._settings['scan_rate'] = value
 
+    @property
+    def strict_sequential(self) -> bool:
+        """
+        Get the flag forcing requests of one poll cycle to be sent one by one.
+
+        Requests are sent simultaneously over TCP by default. Serial lines and devices that 
+        reject pipelined requests need them to be sent strictly one after another.
+
+        :return: True if requests are sent one by one, False otherwise.
+        :rtype: bool
+        """
+        return self._settings.get('strict_sequential', self._get('protocol') != 'TCP')
+
+    @strict_sequential.setter
+    def strict_sequential(self, value: bool) -> None:
+        """
+        Sets the flag forcing requests of one poll cycle to be sent one by one.
+
+        :param value: True to send requests one by one, False to send them simultaneously.
+        :type value: bool
+        :return: nothing
+        :rtype: None
+        """
+        self._settings['strict_sequential'] = value
+
+    @property
+    def max_gap(self) -> int:
+        """
+        Get the largest gap between registers which are still read by one request.
+
+        Registers of the gap are read and discarded. It is 0 by default, since some devices 
+        answer with an exception to a request covering unmapped addresses.
+
+        :return: The largest gap in registers.
+        :rtype: int
+        """
+        return int(self._settings.get('max_gap', 0))
+
+    @max_gap.setter
+    def max_gap(self, value: int) -> None:
+        """
+        Sets the largest gap between registers which are still read by one request.
+
+        Takes effect the next time registers are set.
+
+        :param value: The largest gap in registers.
+        :type value: int
+        :return: nothing
+        :rtype: None
+        """
+        self._settings['max_gap'] = value
+
+    def _run(self, awaitable: Awaitable) -> Any:
+        """
+        Runs the awaitable on the shared event loop, exclusively for this poller, and waits 
+        until it is complete.
+
+        :param awaitable: A coroutine to run.
+        :type awaitable: Awaitable
+        :raises RuntimeError: If called from the thread of the shared loop.
+        :return: The result of the awaitable.
+        :rtype: Any
+        """
+        if self.host.in_loop_thread():
+            # Ожидание результата в потоке цикла заблокировало бы сам цикл
+            raise RuntimeError('Error@Poller._run.',
+                               'synchronous method called on the event loop, use the async one.')
+        return self.host.submit(self._exclusive(awaitable)).result()
+
+    async def _exclusive(self, awaitable: Awaitable) -> Any:
+        """
+        Awaits the awaitable holding the poller's lock, so that a write is never interleaved 
+        with a poll of the same device.
+
+        :param awaitable: A coroutine to await.
+        :type awaitable: Awaitable
+        :return: The result of the awaitable.
+        :rtype: Any
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            return await awaitable
+
     def _get(self, name: str) -> Union[str, int, None]:
         """
         Get a value from the settings dictionary by name.
@@ -157,44 +475,78 @@ class Poller:
             ...
         ]
         """
-        result: Optional[List] = []
+        return self._run(self._read_registers())
+
+    async def registers_async(self) -> Optional[List]:
+        """
+        Polls all requested Modbus registers like `registers`, for coroutines running on the 
+        shared event loop.
+
+        :return: A list of register values, or None if an error occurred.
+        :rtype: Optional[List]
+        """
+        return await self._exclusive(self._read_registers())
+
+    def last_response(self, key: Tuple[int, int, int]) -> Optional[List]:
+        """
+        Get the raw registers received by a request at the last poll.
+
+        :param key: The request key (function code, address, quantity), as stored in the 8th 
+                    column of the rows returned by `registers`.
+        :type key: Tuple[int, int, int]
+        :return: The raw registers, or None if the request has not been received yet.
+        :rtype: Optional[List]
+        """
+        cached: Optional[Tuple[List, List]] = self._raw_cache.get(tuple(key))
+        return cached[0] if cached is not None else None
+
+    async def _read_registers(self) -> Optional[List]:
+        """
+        Polls all requested Modbus registers and decodes their values.
+
+        Requests are sent simultaneously unless `strict_sequential` is set. If a request returns 
+        the same raw registers as at the previous poll, its values are not decoded again.
+
+        :return: A list of register values, or None if an error occurred.
+        :rtype: Optional[List]
+        """
+        # Результат заранее размечен под все регистры плана
+        result: Optional[List] = [None] * self._row_count
+        row: int = 0
         try:
-            # Iterate over each Modbus request in the poller's requests dictionary
-            for fn, requests in self._requests.items():
-                for request in requests.values():
-                    # Build a parameters dictionary for the Modbus request
-                    params: Dict = {'func': fn,
-                                    'reg_address': int(request['address']),
-                                    'reg_qnty': int(request['quantity'])}
-                    # Call the Modbus poll method with the parameters and get the response
-                    response = self._poll(**params)
-
-                    # hp = hpy()
-                    # print(hp.heap())
-                    # Process each mapped register in the request 
-                    # and append its value to the result list
-                    for pos, register in request['map'].items():
-                        content = register['content']
-                        length = int(self.reg_len[content['format']])
-                        raw_value: List = response[pos:pos+length] if response else []
-                        value = self.decode_value(raw_value=raw_value,
-                                                  data_format=content['format'],
-                                                  adjustments=content['adjustments'])
-                        result.append([content['device'],
-                                       content['id'],
-                                       content['address'],
-                                       content['name'],
-                                       content['code'],
-                                       content['format'],
-                                       value,
-                                       response,
-                                       datetime.now().strftime('%d-%m-%Y %H:%M:%S'),
-                                       True,
-                                       fn,
-                                       content['guid'], ])
+            plan: List = self._plan
+            # Значения запросов декодируются по мере получения ответов
+            decoded: List[Optional[List]] = [None] * len(plan)
+            # Не более одной попытки переподключения за цикл опроса
+            reconnected: bool = False
+            if not self.is_connected:
+                reconnected = True
+                await self._reconnect()
+            responses: List = await self._poll_all(plan, range(len(plan)), decoded)
+
+            # Соединение оборвалось во время опроса - переподключаемся и повторяем неудачные запросы
+            failed: List[int] = [index for index, response in enumerate(responses)
+                                 if response is None]
+            if failed and not reconnected and not self.is_connected and await self._reconnect():
+                retried: List = await self._poll_all(plan, failed, decoded)
+                for index, response in zip(failed, retried):
+                    responses[index] = response
+
+            # Одна метка времени на цикл опроса - точность до секунды
+            timestamp: str = time.strftime('%d-%m-%Y %H:%M:%S', time.localtime())
+            for index, request in enumerate(plan):
+                response: Optional[List] = responses[index]
+                values: List = decoded[index] or self._decode(request, response)
+                fn, registers = request[0], request[3]
+                # Вместо ответа строки хранят ключ запроса, сам ответ доступен через last_response
+                key: Tuple[int, int, int] = request[:3]
+
+                # Put the values of the request into the result list.
+                # Строки остаются списками: Widget.daemon_fn изменяет в них признак новизны.
+                for value, register in zip(values, registers):
+                    result[row] = [*register[4], value, key, timestamp, True, fn, register[5]]
+                    row += 1
             # Return the result list
-            del response
-            del content
             return result
         except ModbusException as e:
             # Handle exceptions by printing error information and returning None
@@ -268,65 +620,89 @@ class Poller:
         :returns: This method only sets the value of the registers property.
         :rtype: None
         """
+        max_gap: int = self.max_gap
+        reg_len: Mapping[str, int] = self.reg_len
         for fn, registers in data.items():
+            max_quantity: int = _MAX_QUANTITY.get(int(fn), 125)
             requests: Dict = {}
+            # Текущая группа регистров, адрес её первого регистра 
+            # и адрес, следующий за последним регистром группы
+            request: Optional[Dict] = None
+            start_addr: int = 0
+            end_addr: int = 0
             for register in registers:
-                index = len(requests) - 1
-                if index > -1:
-                    # Мап - список параметров регистров для конкретной группы регистров,
-                    # создан для упрощения сопоставления полученного списка значений с регистрами, 
-                    # к которым эти значения относятся.
-                    # Индекс последнего регистра в мапе
-                    prev_map_index = max(requests[index]['map'].keys())
-
-                    # данные последнего регистра в мапе
-                    prev_map_data = requests[index]['map'][prev_map_index]
-
-                    # Адрес последнего регистра
-                    prev_data_addr = prev_map_data['address']
-
-                    # длина последнего регистра
-                    prev_data_len = prev_map_data['length']
-
-                    # Если у нашего регистра адрес равен адрес предыдущего + сдвиг по длине - это
-                    # регистры из одной группы
-                    if int(register['address']) == int(prev_data_addr) + int(prev_data_len):
-                        request: Dict = requests[index]
-                        request['quantity'] += self.reg_len[register['format']]
-                        map_index: int = prev_map_index + prev_data_len
-                        request['map'][map_index] = {'id': register['id'],
-                                                     'address': register['address'],
-                                                     'length': self.reg_len[register['format']],
-                                                     'content': register}
-                    # Иначе наш регистр - первый регистр следующей группы регистров
-                    else:
-                        requests[index + 1] = {
-                            'address': register['address'],
-                            'quantity': self.reg_len[register['format']],
-                            'map': {
-                                0: {
-                                    'id': register['id'],
-                                    'address': register['address'],
-                                    'length': self.reg_len[register['format']],
-                                    'content': register
-                                }
-                            }
-                        }
-                # Иначе наш регистр - первый регистр первой группы регистров
+                # Адрес и длина нашего регистра
+                reg_addr: int = int(register['address'])
+                reg_length: int = reg_len[register['format']]
+                # Мап - список параметров регистров для конкретной группы регистров,
+                # создан для упрощения сопоставления полученного списка значений с регистрами, 
+                # к которым эти значения относятся. Ключ - индекс регистра в ответе.
+                map_data: Dict = {'id': register['id'],
+                                  'address': register['address'],
+                                  'length': reg_length,
+                                  'content': register}
+
+                # Если наш регистр следует за предыдущим не дальше, чем через max_gap регистров,
+                # и группа не превысит допустимый размер запроса - это регистры из одной группы
+                if (request is not None and 0 <= reg_addr - end_addr <= max_gap 
+                        and reg_addr + reg_length - start_addr <= max_quantity):
+                    request['quantity'] = reg_addr + reg_length - start_addr
+                    request['map'][reg_addr - start_addr] = map_data
+                # Иначе наш регистр - первый регистр следующей группы регистров
                 else:
-                    requests[0] = {
-                        'address': register['address'],
-                        'quantity': self.reg_len[register['format']],
-                        'map': {
-                            0: {
-                                'id': register['id'],
-                                'address': register['address'],
-                                'length': self.reg_len[register['format']],
-                                'content': register
-                            }
-                        }
-                    }
+                    start_addr = reg_addr
+                    request = {'address': register['address'],
+                               'quantity': reg_length,
+                               'map': {0: map_data}}
+                    requests[len(requests)] = request
+                end_addr = reg_addr + reg_length
             self._requests[fn] = requests
+        self._plan = self._build_plan()
+        self._row_count = sum(len(request[3]) for request in self._plan)
+        self._raw_cache = {}
+
+    def _build_plan(self) -> List[Tuple[int, int, int, Tuple, Tuple]]:
+        """
+        Prepares requests for polling, so that no conversions and lookups are left to a poll cycle.
+
+        :return: A list of (function code, address, quantity, registers, runs) tuples, where 
+                 registers is a tuple of (position, length, decode method, adjustment function, 
+                 (device, id, address, name, code, format), guid) and runs is a tuple of 
+                 (position, number of registers, batch decode function) for adjacent registers 
+                 of the same format.
+        :rtype: List[Tuple[int, int, int, Tuple, Tuple]]
+        """
+        plan: List = []
+        for fn, requests in self._requests.items():
+            for request in requests.values():
+                registers: List = []
+                runs: List = []
+                for pos, register in request['map'].items():
+                    content: Dict = register['content']
+                    length: int = self.reg_len[content['format']]
+                    name: str = _FORMAT_METHODS[content['format']]
+                    # Регистр продолжает предыдущую серию того же формата без пропусков
+                    run: Optional[List] = runs[-1] if runs else None
+                    if run and run[3] == name and run[0] + run[1] * run[2] == pos:
+                        run[2] += 1
+                    else:
+                        runs.append([pos, length, 1, name])
+                    registers.append((pos,
+                                      length,
+                                      self._decode_dispatch[content['format']],
+                                      self._adjuster(content['format'], content['adjustments']),
+                                      (content['device'],
+                                       content['id'],
+                                       content['address'],
+                                       content['name'],
+                                       content['code'],
+                                       content['format']),
+                                      content['guid']))
+                runs = [(pos, length * count, self._decoder.batch_decoder(name, count))
+                        for pos, length, count, name in runs]
+                plan.append((fn, int(request['address']), int(request['quantity']), 
+                             tuple(registers), tuple(runs)))
+        return plan
 
     def decode_value(self, raw_value: List, data_format: str, adjustments: List) -> str:
         """
@@ -349,25 +725,10 @@ class Poller:
         :return: A string representing the decoded value with the applied adjustments.
         :rtype: str
         """
-        format_dict = {'Signed': self._decoder.signed,
-                       'Unsigned': self._decoder.unsigned,
-                       'Hex - ASCII': self._decoder.hex_ascii,
-                       'Binary': self._decoder.binary,
-                       'Long AB CD': self._decoder.long_ab_cd,
-                       'Long CD AB': self._decoder.long_cd_ab,
-                       'Long BA DC': self._decoder.long_ba_dc,
-                       'Long DC BA': self._decoder.long_dc_ba,
-                       'Float AB CD': self._decoder.float_ab_cd,
-                       'Float CD AB': self._decoder.float_cd_ab,
-                       'Float BA DC': self._decoder.float_ba_dc,
-                       'Float DC BA': self._decoder.float_dc_ba,
-                       'Double AB CD EF GH': self._decoder.double_ab_cd_ef_gh,
-                       'Double GH EF CD AB': self._decoder.double_gh_ef_cd_ab,
-                       'Double BA DC FE HG': self._decoder.double_ba_dc_fe_hg,
-                       'Double HG FE DC BA': self._decoder.double_hg_fe_dc_ba, }
         if raw_value:
-            if data_format in format_dict:
-                return self._adjust(format_dict[data_format](value=raw_value), adjustments)
+            decode = self._decode_dispatch.get(data_format)
+            if decode is not None:
+                return self._adjust(decode(value=raw_value), adjustments)
             raise ValueError('Error@Poller.decode_value.',
                              f'data_format {data_format} not found in format_dict.')
         raise ValueError('Error@Poller.decode_value.',
@@ -389,72 +750,76 @@ class Poller:
         :return: The encoded value as a list of pymodbus registers.
         :rtype: List[int]
         """
-        format_dict: Dict = {'Signed': self._encoder.signed,
-                             'Unsigned': self._encoder.unsigned,
-                             'Hex - ASCII': self._encoder.hex_ascii,
-                             'Binary': self._encoder.binary,
-                             'Long AB CD': self._encoder.long_ab_cd,
-                             'Long CD AB': self._encoder.long_cd_ab,
-                             'Long BA DC': self._encoder.long_ba_dc,
-                             'Long DC BA': self._encoder.long_dc_ba,
-                             'Float AB CD': self._encoder.float_ab_cd,
-                             'Float CD AB': self._encoder.float_cd_ab,
-                             'Float BA DC': self._encoder.float_ba_dc,
-                             'Float DC BA': self._encoder.float_dc_ba,
-                             'Double AB CD EF GH': self._encoder.double_ab_cd_ef_gh,
-                             'Double GH EF CD AB': self._encoder.double_gh_ef_cd_ab,
-                             'Double BA DC FE HG': self._encoder.double_ba_dc_fe_hg,
-                             'Double HG FE DC BA': self._encoder.double_hg_fe_dc_ba, }
-        
-        if data_format in format_dict:
-            if data_format not in ['Hex - ASCII', 'Binary']:
+        encode = self._encode_dispatch.get(data_format)
+        if encode is not None:
+            if data_format not in ('Hex - ASCII', 'Binary'):
                 if isNumerical(value=value):
                     value = self._adjust_reverse(value=float(value), adjustments=adjustments)
                 else:
                     return None
-            return format_dict[data_format](value=value)
+            return encode(value=value)
         raise ValueError('Error@Poller.encode_value.',
                          f'data_format {data_format} not found in format_dict.')
         
+    def _adjuster(self, data_format: str, adjustments: List) -> Optional[Callable]:
+        """
+        Chooses the cheapest way to apply the adjustments to the decoded values of a register.
+
+        :param data_format: The format of the register.
+        :type data_format: str
+        :param adjustments: A list of adjustments of the register.
+        :type adjustments: List
+        :return: A function applying the adjustments to a decoded value, or None if the decoded 
+                 value is returned as is.
+        :rtype: Optional[Callable]
+        """
+        # Форматы, декодируемые в строку, не преобразуются
+        if data_format in ('Hex - ASCII', 'Binary'):
+            return None
+        compiled: Tuple = _adjustments(adjustments)
+        if compiled and all(operation is None for operation, _, _, _ in compiled):
+            # Только подстановки значений (например, {'0': 'No'}, {'1': 'Yes'}) - поиск по словарю,
+            # при совпадении нескольких подстановок действует первая
+            table: Dict = {}
+            for _, _, number, operand in compiled:
+                table.setdefault(number, operand)
+
+            def substitute(value: Any) -> Optional[str]:
+                if value is None or isinstance(value, str):
+                    return value
+                result: float = float(value)
+                return table[result] if result in table else f"{result:.2f}"
+            return substitute
+        affine: Optional[Callable] = _affine(compiled)
+        if affine is not None:
+            return affine
+        return lambda value: self._apply_adjustments(value, compiled)
+
     @staticmethod
     def _adjust(value: Any, adjustments: Dict) -> Optional[str]:
+        return Poller._apply_adjustments(value, _adjustments(adjustments))
+
+    @staticmethod
+    def _apply_adjustments(value: Any, adjustments: Tuple) -> Optional[str]:
         if value is None:
             return None
         if isinstance(value, str):
             return value
         result: Union[str, float] = float(value)
 
-        for adjustment in adjustments:
-            for operator, operand in adjustment.items():
-                if operator.isdigit():
-                    if result == int(operator):
-                        return operand
-                elif operator == '+':
-                    result += float(operand)
-                elif operator == '-':
-                    result -= float(operand)
-                elif operator == '*':
-                    result *= float(operand)
-                elif operator == '/':
-                    result /= float(operand)
-                elif operator == '^':
-                    result **= float(operand)
-        return str(f"{result:.2f}")
+        for operation, _, number, operand in adjustments:
+            if operation is None:
+                if result == number:
+                    return operand
+            else:
+                result = operation(result, float(operand) if number is None else number)
+        return f"{result:.2f}"
     
     @staticmethod
     def _adjust_reverse(value: str, adjustments: Dict) -> float:
-        for adjustment in adjustments[::-1]:
-            for operator, operand in adjustment.items():
-                if operator == '+':
-                    value -= float(operand)
-                elif operator == '-':
-                    value += float(operand)
-                elif operator == '*':
-                    value /= float(operand)
-                elif operator == '/':
-                    value *= float(operand)
-                elif operator == '^':
-                    value **= (1 / float(operand))
+        for _, reverse, number, operand in _adjustments(adjustments[::-1]):
+            if reverse is not None:
+                value = reverse(value, float(operand) if number is None else number)
         return value
 
     def _get_connection(self):
@@ -462,7 +827,8 @@ class Poller:
         if protocol == 'TCP':
             ip: str = self._get('ip')
             if ip:
-                return self._modbus.ModbusTcpClient(ip)
+                # Переподключение выполняет сам Poller (см. _reconnect)
+                return self._modbus.AsyncModbusTcpClient(ip, reconnect_delay=0)
             print('Exception')
         elif protocol == 'RTU':
             port: str = self._get('port')
@@ -470,11 +836,12 @@ class Poller:
             bytesize: int = self._get('bytesize') if self._get('bytesize') else 8
             parity: str = self._get('parity') if self._get('parity') else 'N'
             stopbits: int = self._get('stopbits') if self._get('stopbits') is not None else 1
-            return self._modbus.ModbusSerialClient(port=port,
-                                                   baudrate=baudrate,
-                                                   bytesize=bytesize,
-                                                   parity=parity,
-                                                   stopbits=stopbits)
+            return self._modbus.AsyncModbusSerialClient(port=port,
+                                                        baudrate=baudrate,
+                                                        bytesize=bytesize,
+                                                        parity=parity,
+                                                        stopbits=stopbits,
+                                                        reconnect_delay=0)
         print('Exception')
         return None
 
@@ -485,10 +852,151 @@ class Poller:
         :return: nothing
         :rtype: None
         """
-        self._connection = self._get_connection()
-        self._connection.connect()
+        self._run(self._connect())
+        print(f'{self} successfully connected to {self._connection}.')
+
+    async def connect_async(self) -> None:
+        """
+        Connects the instance to a Modbus device, for coroutines running on the shared event loop.
+
+        :return: nothing
+        :rtype: None
+        """
+        await self._exclusive(self._connect())
         print(f'{self} successfully connected to {self._connection}.')
 
+    async def _connect(self) -> None:
+        self._connection = self._get_connection()
+        self._read_methods = {1: self._connection.read_coils,
+                              2: self._connection.read_discrete_inputs,
+                              3: self._connection.read_holding_registers,
+                              4: self._connection.read_input_registers, }
+        await self._connection.connect()
+        self._configure_socket()
+
+    async def _reconnect(self) -> bool:
+        """
+        Reopens the connection to the Modbus device.
+
+        :return: True if the instance is connected to a Modbus device, False otherwise.
+        :rtype: bool
+        """
+        if self._connection is None:
+            return False
+        await self._connection.connect()
+        self._configure_socket()
+        return self.is_connected
+
+    def _configure_socket(self) -> None:
+        """
+        Disables Nagle's algorithm and enables TCP keep-alive on the connection socket, so that 
+        short requests are not delayed and a dead connection is detected between polls.
+
+        :return: nothing
+        :rtype: None
+        """
+        transport = getattr(self._connection, 'transport', None)
+        sock = transport.get_extra_info('socket') if transport is not None else None
+        if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError as e:
+            print(f'Error: configure_socket@modbus.py, {type(e).__name__}: {e}')
+
+    async def _poll_all(self, plan: List, indexes: Sequence[int], decoded: List) -> List:
+        """
+        Sends the requests of the plan with the given indexes, simultaneously unless 
+        `strict_sequential` is set, and decodes every successful response into `decoded` as soon 
+        as it is received, while the following requests are still waiting for their responses.
+
+        :param plan: Requests prepared for polling.
+        :type plan: List
+        :param indexes: Indexes of the requests to send.
+        :type indexes: Sequence[int]
+        :param decoded: Decoded values of the requests by index.
+        :type decoded: List
+        :return: A list of responses in the order of indexes, None for every failed request.
+        :rtype: List
+        """
+        def send(index: int) -> Awaitable:
+            fn, address, quantity, _, _ = plan[index]
+            return self._poll(func=fn, reg_address=address, reg_qnty=quantity)
+
+        def decode(index: int, response: Optional[List]) -> None:
+            if response is not None:
+                decoded[index] = self._decode(plan[index], response)
+
+        if self.strict_sequential:
+            # Следующий запрос отправляется до декодирования предыдущего ответа
+            responses: List = []
+            received: Optional[Tuple[int, Optional[List]]] = None
+            for index in indexes:
+                task: asyncio.Task = asyncio.ensure_future(send(index))
+                if received is not None:
+                    # Даём задаче отправить запрос, пока декодируем полученный ответ
+                    await asyncio.sleep(0)
+                    decode(*received)
+                response = await task
+                responses.append(response)
+                received = (index, response)
+            if received is not None:
+                decode(*received)
+            return responses
+
+        async def send_and_decode(index: int) -> Optional[List]:
+            response = await send(index)
+            decode(index, response)
+            return response
+
+        return list(await asyncio.gather(*[send_and_decode(index) for index in indexes]))
+
+    def _decode(self, request: Tuple, response: Optional[List]) -> List:
+        """
+        Decodes the values of a request from its response.
+
+        If the response is the same as at the previous poll, the values of the previous poll are 
+        used without decoding.
+
+        :param request: A request of the plan.
+        :type request: Tuple
+        :param response: The raw registers received.
+        :type response: Optional[List]
+        :return: The values of the registers of the request. The value of a register missing 
+                 from the response (the request has failed) is None.
+        :rtype: List
+        """
+        fn, address, quantity, registers, runs = request
+        key: Tuple[int, int, int] = (fn, address, quantity)
+        cached: Optional[Tuple[List, List]] = self._raw_cache.get(key)
+        if cached is not None and cached[0] == response:
+            # Ответ не изменился - значения берём из кэша
+            return cached[1]
+
+        values: List = []
+        if response and len(response) >= quantity:
+            # Decode each run of registers of the same format at once
+            whole: int = len(response)
+            for pos, span, decode_run in runs:
+                # Серия на весь ответ декодируется без копирования среза
+                values.extend(decode_run(response if pos == 0 and span == whole 
+                                         else response[pos:pos + span]))
+            values = [value if register[3] is None else register[3](value) 
+                      for value, register in zip(values, registers)]
+        else:
+            # Decode each mapped register in the request
+            for pos, length, decode, adjust, _, _ in registers:
+                raw_value: List = response[pos:pos+length] if response else []
+                if not raw_value:
+                    # Запрос не выполнен - значение неизвестно, опрос продолжается
+                    values.append(None)
+                    continue
+                value = decode(value=raw_value)
+                values.append(value if adjust is None else adjust(value))
+        self._raw_cache[key] = (response, values)
+        return values
+
     @property
     def is_connected(self) -> bool:
         """
@@ -497,42 +1005,29 @@ class Poller:
         :return: True if the instance is connected to a Modbus device, False otherwise.
         :rtype: bool
         """
-        return self._connection.is_socket_open()
+        return bool(self._connection and self._connection.connected)
 
-    def _poll(self, func: int, reg_address: int, reg_qnty: int) -> Optional[List]:
-        slave_id: int = self._get('slave_id') if self._get('slave_id') is not None else 1
-        poll_params: Dict = {'address': reg_address,
-                             'count': reg_qnty,
-                             'slave': slave_id}
-        response: Optional[ModbusResponse] = None
+    async def _poll(self, func: int, reg_address: int, reg_qnty: int) -> Optional[List]:
+        read: Optional[Callable] = self._read_methods.get(func)
+        if read is None:
+            print('Exception')
+            return None
         result: Optional[list] = None
         try:
-            if func == 1:
-                response = self._connection.read_coils(**poll_params)
-            elif func == 2:
-                response = self._connection.read_discrete_inputs(**poll_params)
-            elif func == 3:
-                response = self._connection.read_holding_registers(**poll_params)
-            elif func == 4:
-                response = self._connection.read_input_registers(**poll_params)
-            else:
-                print('Exception')
-        except pymodbus.exceptions.ConnectionException as e:  # pylint: disable=unused-variable
+            response: ModbusResponse = await read(address=reg_address, 
+                                                  count=reg_qnty, 
+                                                  slave=self._slave_id)
+        except (pymodbus.exceptions.ConnectionException,
+                asyncio.TimeoutError) as e:  # pylint: disable=unused-variable
             print(f'Error: poll@modbus.py, result: {result}, type: {type(result)}')
             # print(f'{type(e).__name__} occurred, args={str(e.args)}\n{traceback.format_exc()}')
             return None
 
-        if response is not None:
-            if not response.isError():
-                if func in [1, 2]:
-                    result = list(response.bits[:reg_qnty])
-                if func in [3, 4]:
-                    result = list(response.registers)
-                del response
-                return result
+        if response is not None and not response.isError():
+            return _EXTRACTORS[func](response, reg_qnty)
         return None
     
-    def writeSingleCoil(self, address: int, value: bool) -> ModbusResponse:
+    def writeSingleCoil(self, address: int, value: bool) -> Optional[ModbusResponse]:
         """
         Write a single coil value to the specified address in the Modbus device.
 
@@ -540,15 +1035,13 @@ class Poller:
         :type address: int
         :param value: The value to be written to the Modbus device (True for 1, False for 0).
         :type value: bool
-        :return: A ModbusResponse object containing the status of the write operation.
-        :rtype: ModbusResponse
+        :return: A ModbusResponse object containing the status of the write operation, or None
+                 if the request has failed.
+        :rtype: Optional[ModbusResponse]
         """
-        slave_id: int = self._get('slave_id') if self._get('slave_id') is not None else 1
-        return self._connection.write_coil(address=int(address), 
-                                           value=value, 
-                                           slave=slave_id)
+        return self._run(self._write('write_coil', address=int(address), value=value))
     
-    def writeRegisters(self, address: int, value: List) -> ModbusResponse:
+    def writeRegisters(self, address: int, value: List) -> Optional[ModbusResponse]:
         """
         Write a list of values to holding registers with the specified address 
         in the Modbus device.
@@ -557,13 +1050,32 @@ class Poller:
         :type address: int
         :param value: A list of values to be written to the Modbus device.
         :type value: List
-        :return: A ModbusResponse object containing the status of the write operation.
-        :rtype: ModbusResponse
+        :return: A ModbusResponse object containing the status of the write operation, or None
+                 if the request has failed.
+        :rtype: Optional[ModbusResponse]
+        """
+        return self._run(self._write('write_registers', address=int(address), values=value))
+
+    async def _write(self, method: str, **kwargs: Any) -> Optional[ModbusResponse]:
+        """
+        Sends a write request, reopening the connection first if it has been closed or lost.
+
+        :param method: The name of the write method of the connection, e.g. 'write_coil'.
+        :type method: str
+        :param kwargs: Arguments of the write method, except the slave.
+        :type kwargs: Any
+        :return: The response, or None if the request has failed.
+        :rtype: Optional[ModbusResponse]
         """
-        slave_id: int = self._get('slave_id') if self._get('slave_id') is not None else 1
-        return self._connection.write_registers(address=int(address), 
-                                                values=value, 
-                                                slave=slave_id)
+        try:
+            # Без соединения клиент не отправляет запрос - переподключаемся
+            if not self.is_connected and not await self._reconnect():
+                print(f'Error: write@modbus.py, {self} is not connected to {self._connection}.')
+                return None
+            return await getattr(self._connection, method)(slave=self._slave_id, **kwargs)
+        except (ModbusException, asyncio.TimeoutError) as e:
+            print(f'{type(e).__name__} occurred, args={str(e.args)}\n{traceback.format_exc()}')
+        return None
 
     def disconnect(self) -> None:
         """
@@ -571,7 +1083,19 @@ class Poller:
         
         """
         if self._connection:
-            self._connection.close()
+            self._run(self._connection.close())
+            print(f'{self} successfully disconnected from {self._connection}.')
+        else:
+            print(f'{self} already disconnected from {self._connection}.')
+
+    async def disconnect_async(self) -> None:
+        """
+        Close connection to device and print status, for coroutines running on the shared 
+        event loop.
+
+        """
+        if self._connection:
+            await self._exclusive(self._connection.close())
             print(f'{self} successfully disconnected from {self._connection}.')
         else:
             print(f'{self} already disconnected from {self._connection}.')
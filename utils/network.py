@@ -1,7 +1,9 @@
 """
 The serial_ports module provides a function to list the available serial ports on the system.
 
-It uses different methods depending on the operating system to retrieve the available serial ports.
+Ports are enumerated with pyserial's `list_ports`, which asks the operating system (registry and
+SetupAPI on Windows, sysfs on Linux, IOKit on macOS) for the present devices instead of trying
+to open every possible port name.
 
 Usage:
 ------
@@ -14,16 +16,13 @@ Example:
     ports = serial_ports.serial_ports()
     print('Available serial ports: ', ports)
 
-Exceptions:
------------
-- EnvironmentError: raised on unsupported or unknown platforms.
-
 Functions:
 ----------
-    serial_ports():
+    serial_ports(deep_probe=False):
         Lists the serial port names available on the system.
-        
-        :raises EnvironmentError: On unsupported or unknown platforms.
+
+        :param deep_probe: Also open every port and list only the ports which can be opened.
+        :type deep_probe: bool
         :return: A list of the serial ports available on the system.
         :rtype: List
 """
@@ -34,28 +33,25 @@ __version__ = "1.0"
 __license__ = "MIT License"
 
 
-import sys
-import glob
 from typing import List
 import serial
+from serial.tools import list_ports
 
 
-def serial_ports() -> List:
+def serial_ports(deep_probe: bool = False) -> List:
     """Lists serial port names
 
-    :raises EnvironmentError: On unsupported or unknown platforms
+    Ports are not opened by default: opening a port toggles DTR, which resets some devices, and
+    may block on a busy port.
+
+    :param deep_probe: Also open every port and list only the ports which can be opened
+    :type deep_probe: bool
     :return: A list of the serial ports available on the system
     :rtype: List
     """
-    if sys.platform.startswith('win'):
-        ports = [f'COM{i + 1}' for i in range(256)]
-    elif sys.platform.startswith('linux') or sys.platform.startswith('cygwin'):
-        # this excludes your current terminal "/dev/tty"
-        ports = glob.glob('/dev/tty[A-Za-z]*')
-    elif sys.platform.startswith('darwin'):
-        ports = glob.glob('/dev/tty.*')
-    else:
-        raise EnvironmentError('Unsupported platform')
+    ports: List = [port.device for port in list_ports.comports()]
+    if not deep_probe:
+        return ports
 
     result = []
     for port in ports:
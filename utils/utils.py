@@ -9,13 +9,90 @@ __version__ = "1.0"
 __license__ = "MIT License"
 
 
-from typing import Any, Union
+from typing import Any, Dict, Optional, Set, Tuple, Union
 from PySide6 import QtCore
 from PySide6.QtWidgets import QComboBox
 
 
+# Кэш индексов элементов QComboBox: id(cbox) -> (модель, {текст: индекс})
+_cbox_index_cache: Dict[int, Tuple[QtCore.QAbstractItemModel, Dict[str, int]]] = {}
+# Подключённые сигналы, отдельно от кэша: сигнал destroyed - id(cbox),
+# сигналы изменения модели - id(модели) -> id(cbox)
+_cbox_connected: Set[int] = set()
+_model_connected: Dict[int, Set[int]] = {}
+
+
+def _drop_cbox_index(key: int) -> None:
+    _cbox_index_cache.pop(key, None)
+
+
+def _forget_cbox(key: int) -> None:
+    _drop_cbox_index(key)
+    _cbox_connected.discard(key)
+    for keys in _model_connected.values():
+        keys.discard(key)
+
+
+def _connect_cbox(cbox: QComboBox, model: QtCore.QAbstractItemModel) -> None:
+    """Connects the signals dropping the cached indexes of a QComboBox, once per combo box and 
+    once per model of the combo box
+
+    :param cbox: The QComboBox whose indexes are cached
+    :type cbox: QComboBox
+    :param model: The current model of the QComboBox
+    :type model: QtCore.QAbstractItemModel
+
+    :return: nothing
+    :rtype: None
+    """
+    key: int = id(cbox)
+    if key not in _cbox_connected:
+        _cbox_connected.add(key)
+        cbox.destroyed.connect(lambda *_: _forget_cbox(key))
+    model_key: int = id(model)
+    keys: Optional[Set[int]] = _model_connected.get(model_key)
+    if keys is None:
+        keys = _model_connected[model_key] = set()
+        model.destroyed.connect(lambda *_: _model_connected.pop(model_key, None))
+    if key not in keys:
+        keys.add(key)
+        for signal in (model.modelReset, model.layoutChanged, model.dataChanged,
+                       model.rowsInserted, model.rowsRemoved, model.rowsMoved):
+            signal.connect(lambda *_: _drop_cbox_index(key))
+
+
+def _cbox_indexes(cbox: QComboBox) -> Dict[str, int]:
+    """Returns a mapping of the case-folded item texts of a QComboBox to their indexes
+
+    The mapping is built once per combo box and dropped whenever the items of its model change
+    or the combo box is destroyed.
+
+    :param cbox: The QComboBox to index
+    :type cbox: QComboBox
+
+    :return: The first index of every item text
+    :rtype: Dict[str, int]
+    """
+    key: int = id(cbox)
+    model: QtCore.QAbstractItemModel = cbox.model()
+    cached = _cbox_index_cache.get(key)
+    if cached is not None and cached[0] is model:
+        return cached[1]
+    # Модель могла быть заменена через setModel: сигналы подключаются к новой модели
+    _connect_cbox(cbox, model)
+    indexes: Dict[str, int] = {}
+    for index in range(cbox.count()):
+        indexes.setdefault(cbox.itemText(index).casefold(), index)
+    _cbox_index_cache[key] = (model, indexes)
+    return indexes
+
+
 def get_cbox_index(cbox: QComboBox, item: str) -> int:
     """Returns the index of the specified item in a QComboBox
+
+    The match is case-insensitive, as with `QComboBox.findText` and `Qt.MatchFixedString`,
+    but is looked up in a cached mapping instead of walking all the items.
+
     :param cbox: The QComboBox to search in
     :type cbox: QComboBox
     :param item: The item to search for
@@ -24,10 +101,7 @@ def get_cbox_index(cbox: QComboBox, item: str) -> int:
     :return: The index of the item, or -1 if it is not found
     :rtype: int
     """
-    return cbox.findText(
-        item,
-        QtCore.Qt.MatchFixedString
-    )
+    return _cbox_indexes(cbox).get(item.casefold(), -1)
 
 
 def set_cbox_value(cbox: QComboBox, value: str) -> None:
@@ -53,6 +127,15 @@ def isNumerical(value: Any) -> bool:
     :return: True if the value can be converted to a floating-point number, False otherwise
     :rtype: bool
     """
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, str):
+        # Быстрая проверка без исключения: целые и десятичные числа вида '-12.5'
+        digits: str = value.strip()
+        if digits[:1] in ('+', '-'):
+            digits = digits[1:]
+        if digits.replace('.', '', 1).isdecimal():
+            return True
     try:
         float(value)
         return True
@@ -2,8 +2,8 @@
 This module contains classes for running background tasks with signals to indicate progress and 
 completion. The WorkerSignals class defines signals emitted during task execution.
 
-The Worker class is a runnable class that emits signals indicating the progress of a background
-task.
+The Worker class is the base class of the objects running a background task and emitting 
+signals indicating the progress of the task.
 The PollingWorker class is a subclass of Worker that implements a polling worker for Modbus
 communication.
 """
@@ -14,17 +14,22 @@ __version__ = "1.0"
 __license__ = "MIT License"
 
 
-from datetime import datetime
-from typing import Callable, Dict, List, Optional
+import asyncio
+import concurrent.futures
+import time
+import traceback
+from collections import deque
+from typing import Callable, List, Optional, Set
 
-from PySide6.QtCore import QThread, QObject, Signal, Slot, QRunnable
+from PySide6.QtCore import QObject, Signal, Slot
 
 from utils.modbus import Poller
 
 
 class WorkerSignals(QObject):
     """
-    WorkerSignals class defines the signals emitted by a QRunnable worker.
+    WorkerSignals class defines the signals emitted by the workers. A single instance is shared 
+    by all the workers, receivers tell the workers apart by the guid passed with the signal.
     
     Attributes:
     finished (Signal[str]): Signal emitted when the worker has finished its task. The signal
@@ -43,50 +48,51 @@ class WorkerSignals(QObject):
     progress = Signal(int)
 
 
-class Worker(QRunnable):
+class Worker(QObject):
     """
-    :class:             `Worker` is a runnable class that emits signals indicating the progress of 
-                        a background task.
+    :class:             `Worker` is the base class of the objects running a background task and 
+                        emitting signals indicating the progress of the task.
 
     :param guid:        a unique identifier for the task.
     :type guid:         str
-    :param sleep:       the time, in milliseconds, that the task will sleep before finishing.
+    :param sleep:       the time, in milliseconds, that the task sleeps between iterations.
     :type sleep:        int
-    :ivar signals:      an instance of `WorkerSignals` used to emit signals during task execution.
+    :ivar signals:      the `WorkerSignals` instance shared by all the workers, used to emit 
+                        signals during task execution.
     :type signals:      WorkerSignals
     :ivar _poller:      a reference to a `Poller` instance used to monitor task progress 
                         (optional).
     :type _poller:      Optional[Poller]
-    :ivar _exec_time:   the amount of time, in milliseconds, the task has been executing.
-    :type _exec_time:   int
-    :ivar result:       a dictionary containing the result of the task.
-    :type result:       Dict
 
     .. note::
-        To use the `Worker` class, first create an instance with the appropriate arguments, 
-        and then submit it to a `QThreadPool` for execution.
+        Subclasses implement `start`, `stop`, `isFinished` and `wait`. A started worker adds 
+        itself to `_active`, so that :meth:`wait_all` can wait for it.
     """
+    # Запущенные воркеры: ссылки хранятся, пока воркер не завершится
+    _active: Set['Worker'] = set()
+    # Общий объект сигналов всех воркеров, создаётся вместе с первым воркером
+    _signals: Optional[WorkerSignals] = None
+
     def __init__(self, guid: str, sleep: int) -> None:
         super().__init__()
-        self.signals = WorkerSignals()
+        if Worker._signals is None:
+            Worker._signals = WorkerSignals()
+        self.signals: WorkerSignals = Worker._signals
         self.sleep = sleep
         self.guid = guid
         self._poller: Optional[Poller] = None
-        self._exec_time: int = 0
-        self.result: Dict = {'guid': self.guid}
 
-    def __del__(self):
-        print(f'{self} deleted.')
+    @classmethod
+    def wait_all(cls) -> None:
+        """
+        Blocks until all the started workers have finished.
 
-    @Slot()
-    # @memory_profiler.profile
-    def run(self):
-        # self.signals.result.emit(self.result)
-        if self._exec_time > self.sleep:
-            self._exec_time = 0
-        QThread.msleep(self.sleep - self._exec_time)
-        # time.sleep(1)
-        self._exec_time = 0
+        :return: nothing
+        :rtype: None
+        """
+        for worker in list(cls._active):
+            worker.wait()
+        cls._active.clear()
 
 
 class PollingWorker(Worker):
@@ -105,12 +111,28 @@ class PollingWorker(Worker):
 
     :ivar poller:   An instance of the :class:`Poller` class that is used to perform Modbus 
                     communication.
+    :ivar latest:   The latest poll result, not yet taken by the GUI thread. Holds at most one 
+                    result, a newer result replaces an older one.
+    :type latest:   deque
+    :ivar _last_values: The values of the rows put to `latest` last, None for a failed register.
+    :type _last_values: Optional[List]
+    :ivar _stopping:    Whether :meth:`stop` has been called.
+    :type _stopping:    bool
+    :ivar _wakeup:  An event interrupting the pause between polls when the worker is stopped.
+    :type _wakeup:  Optional[asyncio.Event]
+    :ivar _future:  The future of the polling loop running on the shared event loop.
+    :type _future:  Optional[concurrent.futures.Future]
 
     :returns:       An instance of :class:`PollingWorker`.
     """
     def __init__(self, guid: str, sleep: int, fn: Callable) -> None:
         super().__init__(guid, sleep)
         self.polling = fn
+        self.latest: deque = deque(maxlen=1)
+        self._last_values: Optional[List] = None
+        self._stopping: bool = False
+        self._wakeup: Optional[asyncio.Event] = None
+        self._future: Optional[concurrent.futures.Future] = None
 
     @property
     def poller(self) -> Poller:
@@ -128,7 +150,7 @@ class PollingWorker(Worker):
         self._poller = poller
 
     @Slot(int, bool)
-    def writeSingleCoil(self, address: int, value: bool) -> None:
+    def writeSingleCoil(self, address: int, value: bool) -> bool:
         """
         Writes a single coil value to the specified address using the associated Poller object.
 
@@ -137,16 +159,17 @@ class PollingWorker(Worker):
         :type address: int
         :param value: The value to write to the coil.
         :type value: bool
-        :return: A ModbusResponse object indicating the success or failure of the write operation.
-        :rtype: ModbusResponse
+        :return: True if success and False otherwise
+        :rtype: bool
         """
-        self._poller.writeSingleCoil(address=address, value=value)
+        response = self._poller.writeSingleCoil(address=address, value=value)
+        return response is not None and not response.isError()
 
     @Slot(int, str, list, str, result=None)
     def writeRegisters(self, address: int, 
                        data_format: str, 
                        adj: List, 
-                       value: str) -> bool:
+                       value: str) -> Optional[bool]:
         """
         Writes one or more 16-bit registers to the specified address using the associated Poller 
         object.
@@ -159,29 +182,127 @@ class PollingWorker(Worker):
         :type adj: List
         :param value: The value or values to write to the registers, as a string.
         :type value: str
-        :return: True if success and False otherwise
-        :rtype: bool
+        :return: True if success, False if the write has failed and None if the value does not
+                 match the data format
+        :rtype: Optional[bool]
         """
         encoded_value = self._poller.encode_value(value=value, 
                                                   data_format=data_format, 
                                                   adjustments=adj)
-        if encoded_value is not None:
-            self._poller.writeRegisters(address=address, value=encoded_value)
-            return True
-        return False
-
-    @Slot()
-    def run(self):
-        self._poller.connect()
-        while True:
-            started_at = datetime.now()
-            result: Dict = {'guid': self.guid,
-                            'registers': self._poller.registers}
-            self.signals.result.emit(result)
-            self._exec_time = int(((datetime.now() - started_at).total_seconds()) * 1000)
-            super().run()
-            if self.polling() is False:
-                break
-
-        self._poller.disconnect()
-        self.signals.finished.emit(self.guid)
+        if encoded_value is None:
+            return None
+        response = self._poller.writeRegisters(address=address, value=encoded_value)
+        return response is not None and not response.isError()
+
+    def start(self) -> None:
+        """
+        Starts polling. The polling loop is a coroutine on the event loop shared by all the 
+        pollers (see :class:`AsyncPollerHost`), so the worker does not occupy a thread of its own.
+
+        :return: nothing
+        :rtype: None
+        """
+        Worker._active = {worker for worker in Worker._active if not worker.isFinished()}
+        self._last_values = None
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        Worker._active.add(self)
+        self._future = self._poller.host.submit(self._poll_loop())
+
+    def stop(self) -> None:
+        """
+        Asks the worker to finish without waiting for the current pause between polls to 
+        elapse. May be called from any thread, a poll already running is completed.
+
+        :return: nothing
+        :rtype: None
+        """
+        self._stopping = True
+        if self._wakeup is not None and self._poller is not None:
+            self._poller.host.call_soon(self._wakeup.set)
+
+    def isFinished(self) -> bool:
+        """
+        Returns whether the polling loop has finished.
+
+        :return: True if the polling loop has finished or was never started, False otherwise
+        :rtype: bool
+        """
+        return self._future is None or self._future.done()
+
+    def wait(self) -> None:
+        """
+        Blocks until the polling loop has finished.
+
+        :return: nothing
+        :rtype: None
+        """
+        if self._future is not None:
+            concurrent.futures.wait([self._future])
+
+    async def _poll_loop(self) -> None:
+        """
+        Polls the registers, puts the results to `latest` and pauses between polls until 
+        polling is switched off or the worker is stopped.
+
+        :return: nothing
+        :rtype: None
+        """
+        poller: Poller = self._poller
+        try:
+            try:
+                await poller.connect_async()
+            except Exception as e:  # pylint: disable=broad-except
+                # Соединение не создано (например, неверные настройки) - опрос невозможен
+                print(f'{type(e).__name__} occurred, args={str(e.args)}\n'
+                      f'{traceback.format_exc()}')
+                return
+            while True:
+                started_ns: int = time.perf_counter_ns()
+                try:
+                    registers: Optional[List] = await poller.registers_async()
+                except Exception as e:  # pylint: disable=broad-except
+                    print(f'{type(e).__name__} occurred, args={str(e.args)}\n'
+                          f'{traceback.format_exc()}')
+                    registers = None
+                # Ошибка опроса не останавливает воркер: в следующем цикле Poller
+                # переподключается и повторяет запросы
+                if registers is not None:
+                    # Результат отправляется, только если изменились значения, метка времени
+                    # опроса не сравнивается
+                    values: List = [row[6] for row in registers]
+                    if values != self._last_values:
+                        self._last_values = values
+                        self._put_result(registers)
+                exec_time: int = (time.perf_counter_ns() - started_ns) // 1_000_000
+                if self._stopping:
+                    break
+                # Пауза прерывается вызовом stop()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), 
+                                           (self.sleep - (exec_time if exec_time <= self.sleep 
+                                                          else 0)) / 1000)
+                except asyncio.TimeoutError:
+                    pass
+                if self._stopping or self.polling() is False:
+                    break
+        finally:
+            try:
+                await poller.disconnect_async()
+            except Exception as e:  # pylint: disable=broad-except
+                print(f'{type(e).__name__} occurred, args={str(e.args)}\n'
+                      f'{traceback.format_exc()}')
+            self.signals.finished.emit(self.guid)
+
+    def _put_result(self, registers: List) -> None:
+        """
+        Puts the result of a poll to `latest`.
+
+        :param registers: The rows polled.
+        :type registers: List
+        :return: nothing
+        :rtype: None
+        """
+        # Результат кладётся в слот последнего результата, который GUI забирает по своему
+        # таймеру (Widget.daemon_fn)
+        self.latest.append({'guid': self.guid, 'registers': registers})